@@ -1,5 +1,8 @@
 """Initialize API."""
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -9,18 +12,38 @@ from app import (
     authors,
     donations,
     github,
+    health,
     images,
     newsletter,
     posts,
     tags,
 )
+from clients import ghost, ghost_async, images as image_transformer
 from config import settings
-from database import Base, engine
+from database import Base, connect_databases, disconnect_databases, dispose_engines, engine
 from log import LOGGER
 
 Base.metadata.create_all(bind=engine)
 
 
+@asynccontextmanager
+async def lifespan(api: FastAPI) -> AsyncIterator[None]:
+    """
+    Start background workers, then release them & pooled client connections when the API shuts down.
+
+    :param FastAPI api: API application.
+    """
+    await connect_databases()
+    await images.start_image_queue()
+    yield
+    await images.stop_image_queue()
+    await ghost_async.aclose()
+    ghost.close()
+    image_transformer.close()
+    await disconnect_databases()
+    dispose_engines()
+
+
 def create_app() -> FastAPI:
     """
     Initialize API application.
@@ -34,6 +57,7 @@ def create_app() -> FastAPI:
         debug=True,
         docs_url="/",
         openapi_url="/api.json",
+        lifespan=lifespan,
     )
 
     # Define Middleware
@@ -55,6 +79,7 @@ def create_app() -> FastAPI:
     api.include_router(images.router)
     api.include_router(tags.router)
     api.include_router(github.router)
+    api.include_router(health.router)
     LOGGER.success("API successfully started.")
 
     return api
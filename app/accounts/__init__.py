@@ -2,8 +2,8 @@
 
 from fastapi import APIRouter, HTTPException
 
-from config import settings
-from database import ghost_db
+from database import ghost_async_db, queries
+from database.async_db import record_to_dict
 from log import LOGGER
 
 router = APIRouter(prefix="/account", tags=["accounts"])
@@ -21,11 +21,8 @@ async def get_comments():
     :returns: List[Comment]
     """
     try:
-        sql_query = ""
-        with open(f"{settings.BASE_DIR}/database/queries/posts/selects/get_comments.sql", "r", encoding="utf-8") as f:
-            sql_query = f.read()
-        comments = ghost_db.execute_query(sql_query)
-        comments = [dict(r._mapping) for r in comments]
+        comments = await ghost_async_db.fetch_all(queries["posts/selects/get_comments"])
+        comments = [record_to_dict(r) for r in comments]
         LOGGER.success(f"Successfully fetched {len(comments)} Ghost comments.")
         return comments
     except HTTPException as e:
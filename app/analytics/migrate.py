@@ -3,8 +3,7 @@
 from typing import Any, Dict, List
 
 from clients import gbq
-from config import settings
-from database import feature_db
+from database import feature_db, queries
 
 
 def import_site_analytics(timeframe: str) -> Dict[str, List[Any]]:
@@ -15,7 +14,7 @@ def import_site_analytics(timeframe: str) -> Dict[str, List[Any]]:
 
     :returns: Dict[str, List[Any]]
     """
-    sql_query = open(f"{settings.BASE_DIR}/database/queries/analytics/{timeframe}.sql", encoding="utf-8").read()
+    sql_query = queries.sql(f"analytics/{timeframe}")
     sql_table = f"{timeframe}_stats"
     query_job = gbq.query(sql_query)
     result = query_job.result()
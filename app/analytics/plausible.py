@@ -1,12 +1,13 @@
 """Fetch site analytics via Plausible API."""
 
-from typing import List, Optional
+from typing import List, Optional, Set
 
 import requests
 from fastapi import HTTPException
 from requests.exceptions import RequestException
 
-from clients import ghost
+from clients import ghost, ghost_index
+from clients.ghost_index import INDEX_FIELDS
 from config import settings
 from log import LOGGER
 
@@ -24,6 +25,7 @@ def top_visited_pages_by_timeframe(time_period: str, limit=100) -> Optional[List
     if results:
         results = filter_results(results)
         results = enrich_results(results)
+        LOGGER.info(f"Ghost index stats after enriching `{time_period}` results: {ghost_index.stats()}")
         return results
     return []
 
@@ -67,14 +69,13 @@ def fetch_top_visited_pages(time_period: str, limit=30) -> List[Optional[dict]]:
         LOGGER.error(f"Unexpected Exception when fetching Plausible top URLs: {e}")
 
 
-def fetch_all_ghost_urls() -> List[dict]:
+def fetch_all_ghost_urls() -> Set[str]:
     """
-    List all slugs for Ghost posts & pages.
+    List paths of all Ghost pages.
 
-    :returns: List[dict]
+    :returns: Set[str]
     """
-    ghost_pages = ghost.get_pages()
-    return [f"/{page.get('slug')}/" for page in ghost_pages if page.get("slug") is not None and page is not None]
+    return ghost_index.page_paths()
 
 
 def filter_results(results_list: List[dict]) -> List[dict]:
@@ -112,7 +113,11 @@ def enrich_url_with_post_data(page_result: dict) -> Optional[dict]:
     :returns: Optional[dict]
     """
     slug = page_result["page"].replace("/", "")
-    post = ghost.get_post_by_slug(slug)
+    post = ghost_index.get_by_slug(slug)
+    if post is None:
+        post = ghost.get_post_by_slug(slug, fields=INDEX_FIELDS, formats=None, include=None)
+        if post:
+            ghost_index.upsert(post)
     if post and page_result["pageviews"] and page_result["pageviews"] > 2:
         page_result["slug"] = slug
         page_result["title"] = post["title"]
@@ -1,13 +1,13 @@
 """Author management."""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 
 from clients import sms
 from config import settings
-from database import ghost_db
-from database.read_sql import collect_sql_queries
+from database import ghost_async_db, queries
 from database.schemas import PostUpdate
+from database.sql_db import failed_queries
 from log import LOGGER
 
 router = APIRouter(prefix="/authors", tags=["authors"])
@@ -24,10 +24,15 @@ async def authors_bulk_update_metadata() -> JSONResponse:
 
     :returns: JSONResponse
     """
-    update_author_queries = collect_sql_queries("users")
-    update_author_results = ghost_db.execute_queries(update_author_queries)
-    if update_author_results is None:
-        raise HTTPException(status_code=204, detail="Post update ignored as post was just updated.")
+    update_author_queries = queries.collection("users")
+    update_author_results = await ghost_async_db.execute_queries(update_author_queries)
+    failed = failed_queries(update_author_results)
+    if failed:
+        LOGGER.error(f"Failed to update author metadata: {failed}")
+        return JSONResponse(
+            content={"authors": update_author_results},
+            status_code=500 if len(failed) == len(update_author_results) else 207,
+        )
     LOGGER.success(f"Updated author metadata for {len(update_author_results)} authors.")
     return JSONResponse(
         content={"authors": update_author_results},
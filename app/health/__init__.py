@@ -0,0 +1,22 @@
+"""Runtime health of shared resources."""
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from database import pool_stats
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+
+@router.get(
+    "/pools/",
+    summary="Database connection pool utilization.",
+    description="Report connections checked in, checked out & in overflow for each database pool of this worker.",
+)
+async def database_pools() -> JSONResponse:
+    """
+    Connection pool utilization of each database.
+
+    :returns: JSONResponse
+    """
+    return JSONResponse(content=pool_stats(), status_code=200)
@@ -1,43 +1,83 @@
 """Generate optimized images to be served from Google Cloud CDN."""
 
-from typing import Optional
+from typing import List, Optional
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
 
+from app.images.jobs import ImageQueue
+from app.images.manifest import record_variants, stale_images
 from clients import images
 from config import settings
+from database import get_db
 from database.schemas import PostUpdate
 from log import LOGGER
 
 router = APIRouter(prefix="/images", tags=["images"])
 
 
+def optimize_feature_image(feature_image: str) -> List[str]:
+    """
+    Generate retina & resized variants of a post's feature image if they don't exist.
+
+    :param str feature_image: URL of a post's feature image.
+
+    :returns: List[str]
+    """
+    image_blob = images.blob_from_url(feature_image)
+    if image_blob is None:
+        return []
+    new_images = [images.create_retina_image(image_blob), *images.create_image_variants(image_blob)]
+    return [image.name for image in new_images if image is not None]
+
+
+image_queue: Optional[ImageQueue] = None
+
+
+async def start_image_queue() -> None:
+    """Open the on-disk image queue & start its workers when the API starts."""
+    global image_queue
+    image_queue = ImageQueue(
+        settings.IMAGE_QUEUE_PATH,
+        handler=optimize_feature_image,
+        workers=settings.IMAGE_QUEUE_WORKERS,
+    )
+    await image_queue.start()
+
+
+async def stop_image_queue() -> None:
+    """Stop image queue workers when the API shuts down."""
+    global image_queue
+    if image_queue is not None:
+        await image_queue.stop()
+        image_queue = None
+
+
 @router.post(
     "/",
     summary="Optimize single post image.",
-    description="Generate retina and mobile feature_image for a single post upon update.",
+    description="Queue generation of retina and mobile feature_image for a single post upon update.",
+    status_code=202,
 )
 async def optimize_post_image(post_update: PostUpdate) -> JSONResponse:
     """
-    Generate retina version of a post's feature image if one doesn't exist.
+    Queue generation of a post's retina & resized feature images.
 
     :param PostUpdate post_update: Incoming payload for an updated Ghost post.
 
     :returns: JSONResponse
     """
-    new_images = []
     post = post_update.post.current
     feature_image = post.feature_image
-    title = post.title
     if feature_image:
-        new_images.append(images.create_retina_image(feature_image))
-        new_images.append(images.create_mobile_image(feature_image))
-        new_images = [image for image in new_images if image is not None]
-        if bool(new_images):
-            LOGGER.info(f"Generated {len(new_images)} images for post `{title}`: {new_images}")
-            return JSONResponse(new_images)
-        return JSONResponse({post.title: "Retina & mobile images already exist"})
+        if image_queue is None:
+            LOGGER.error(f"Image queue is not running; feature image of post `{post.title}` was not queued.")
+            raise HTTPException(status_code=503, detail="Image queue is not running.")
+        if image_queue.enqueue(feature_image, post.title):
+            LOGGER.info(f"Queued feature image of post `{post.title}` for optimization.")
+            return JSONResponse({post.title: "Queued image for optimization"}, status_code=202)
+        return JSONResponse({post.title: "Image is already queued for optimization"}, status_code=202)
     return JSONResponse({post.title: "No images exist for optimization"})
 
 
@@ -54,25 +94,40 @@ async def bulk_transform_images(
         title="directory",
         description="Subdirectory of remote CDN to transverse and transform images.",
         max_length=50,
-    )
+    ),
+    dry_run: bool = Query(
+        default=False,
+        title="dry_run",
+        description="Return the planned operations with cost estimates instead of modifying the CDN.",
+    ),
+    db: Session = Depends(get_db),
 ) -> JSONResponse:
     """
     Apply transformations to images uploaded within the current month.
     Optionally accepts a `directory` parameter to override image directory.
 
     :param Optional[str] directory: Remote directory to recursively fetch images and apply transformations.
+    :param bool dry_run: Plan the run without modifying the CDN.
+    :param Session db: ORM database session holding the image manifest.
 
     :returns: JSONResponse
     """
     try:
         if directory is None:
             directory = settings.GCP_BUCKET_FOLDER
+        inventory = images.inventory(directory)
+        if dry_run:
+            image_blobs = stale_images(db, images.get_standard_blobs(directory, inventory), inventory)
+            return JSONResponse(images.plan_transformations(directory, inventory, image_blobs))
+        purged_images = images.purge_unwanted_images(directory, inventory)
+        image_blobs = stale_images(db, images.get_standard_blobs(directory, inventory), inventory)
         transformed_images = {
-            "purged": images.purge_unwanted_images(directory),
-            "retina": images.retina_transformations(directory),
-            "mobile": images.mobile_transformations(directory),
+            "purged": purged_images,
+            "retina": images.retina_transformations(directory, inventory, image_blobs),
+            "variants": images.variant_transformations(directory, inventory, image_blobs),
             # "standard": gcs.standard_transformations(directory),
         }
+        record_variants(db, image_blobs, inventory)
         response = []
         for k, v in transformed_images.items():
             if v is not None:
@@ -87,16 +142,19 @@ async def bulk_transform_images(
 
 
 @router.get("/sort/")
-async def bulk_organize_images(directory: Optional[str] = None) -> JSONResponse:
+async def bulk_organize_images(directory: Optional[str] = None, dry_run: bool = False) -> JSONResponse:
     """
     Sort retina and mobile images into their appropriate directories.
 
     :param Optional[str] directory: Remote directory to organize images into subdirectories.
+    :param bool dry_run: Return the planned moves with cost estimates instead of modifying the CDN.
 
     :returns: JSONResponse
     """
     if directory is None:
         directory = settings.GCP_BUCKET_FOLDER
+    if dry_run:
+        return JSONResponse(images.plan_retina_organization(directory))
     retina_images = images.organize_retina_images(directory)
     LOGGER.success(f"Moved {len(retina_images)} retina images.")
     return JSONResponse(
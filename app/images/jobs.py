@@ -0,0 +1,216 @@
+"""Persistent work queue for optimizing post images outside of webhook requests."""
+
+import asyncio
+import os
+import socket
+import sqlite3
+import threading
+import time
+from typing import Callable, List, Optional, Set
+
+from log import LOGGER
+
+# Seconds a worker waits after an unexpected error before claiming another job.
+WORKER_ERROR_DELAY = 1
+
+# Seconds a claimed job stays leased to its process without a heartbeat, & seconds between heartbeats.
+JOB_LEASE = 120
+HEARTBEAT_INTERVAL = 30
+
+
+class ImageQueue:
+    """
+    On-disk queue of image URLs drained by a pool of async workers.
+
+    Each URL is queued at most once: saving the same post repeatedly while its image is pending
+    or in progress does not add more work. A claimed job is leased to the claiming process, which
+    renews the lease while it works; jobs whose lease has expired (ie: the process died) are picked up again.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        handler: Callable[[str], List[str]],
+        workers: int = 2,
+        max_attempts: int = 3,
+        lease: float = JOB_LEASE,
+    ):
+        """
+        :param str path: SQLite file holding queued jobs.
+        :param Callable[[str], List[str]] handler: Blocking function optimizing the image at a URL.
+        :param int workers: Number of jobs processed concurrently.
+        :param int max_attempts: Times a job is attempted before it is dropped.
+        :param float lease: Seconds a claimed job is reserved for this process without a heartbeat.
+        """
+        self.path = path
+        self.handler = handler
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.lease = lease
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{id(self):x}"
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS image_jobs ("
+            "url TEXT PRIMARY KEY, title TEXT, status TEXT NOT NULL DEFAULT 'pending', "
+            "attempts INTEGER NOT NULL DEFAULT 0, enqueued_at REAL NOT NULL, owner TEXT, lease_expires REAL)"
+        )
+        columns = {column[1] for column in self._db.execute("PRAGMA table_info(image_jobs)")}
+        for column, column_type in (("owner", "TEXT"), ("lease_expires", "REAL")):
+            if column not in columns:
+                self._db.execute(f"ALTER TABLE image_jobs ADD COLUMN {column} {column_type}")
+        self._lock = threading.Lock()
+        self._claimed: Set[str] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+
+    def enqueue(self, url: str, title: Optional[str] = None) -> bool:
+        """
+        Queue an image for optimization unless it is already pending or in progress.
+
+        :param str url: URL of the image to optimize.
+        :param Optional[str] title: Title of the post the image belongs to, for logging.
+
+        :returns: bool
+        """
+        with self._lock:
+            queued = self._db.execute(
+                "INSERT OR IGNORE INTO image_jobs (url, title, enqueued_at) VALUES (?, ?, ?)",
+                (url, title, time.time()),
+            ).rowcount
+        if queued and self._wakeup is not None:
+            self._wakeup.set()
+        return bool(queued)
+
+    def pending(self) -> int:
+        """
+        Number of jobs waiting or in progress.
+
+        :returns: int
+        """
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM image_jobs").fetchone()[0]
+
+    async def start(self) -> None:
+        """Start the workers & the heartbeat renewing leases of jobs they claim."""
+        self._wakeup = asyncio.Event()
+        self._wakeup.set()
+        self._tasks = [asyncio.create_task(self._work(), name=f"image-queue-{i}") for i in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._heartbeat(), name="image-queue-heartbeat"))
+        LOGGER.info(f"Started {self.workers} image queue workers with {self.pending()} queued jobs.")
+
+    async def stop(self) -> None:
+        """Stop the workers & close the queue; unfinished jobs stay queued on disk."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        with self._lock:
+            # Other API processes sharing the file may still be working on their own jobs.
+            self._db.executemany(
+                "UPDATE image_jobs SET status = 'pending', owner = NULL, lease_expires = NULL "
+                "WHERE url = ? AND owner = ?",
+                [(url, self.owner) for url in self._claimed],
+            )
+            self._claimed.clear()
+            self._db.close()
+
+    async def _work(self) -> None:
+        """Process queued jobs until cancelled, sleeping while the queue is empty."""
+        while True:
+            try:
+                job = self._claim()
+                if job is None:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+                await self._process(*job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                LOGGER.error(f"Image queue worker failed while claiming or completing a job: {e}")
+                await asyncio.sleep(WORKER_ERROR_DELAY)
+
+    async def _heartbeat(self) -> None:
+        """Renew leases of jobs claimed by this process until cancelled."""
+        interval = min(HEARTBEAT_INTERVAL, self.lease / 3)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self._renew()
+            except Exception as e:
+                LOGGER.error(f"Image queue failed to renew leases of claimed jobs: {e}")
+
+    async def _process(self, url: str, title: Optional[str], attempts: int) -> None:
+        """
+        Optimize a claimed image, then remove the job or queue it for another attempt.
+
+        :param str url: URL of the image to optimize.
+        :param Optional[str] title: Title of the post the image belongs to.
+        :param int attempts: Attempts made so far, including this one.
+        """
+        try:
+            new_images = await asyncio.to_thread(self.handler, url)
+        except Exception as e:
+            LOGGER.error(f"Failed to optimize image `{url}` (attempt {attempts}/{self.max_attempts}): {e}")
+            self._retry(url, attempts)
+            return
+        LOGGER.info(f"Optimized image for post `{title}`: {new_images}")
+        self._finish(url)
+
+    def _claim(self) -> Optional[tuple]:
+        """
+        Lease the oldest job which is pending, or whose lease has expired, to this process.
+
+        The job is selected & leased in one statement, so API processes sharing the queue file never claim the same job.
+
+        :returns: Optional[tuple]
+        """
+        claimable = "(status = 'pending' OR IFNULL(lease_expires, 0) < :now)"
+        with self._lock:
+            now = time.time()
+            job = self._db.execute(
+                "UPDATE image_jobs SET status = 'processing', attempts = attempts + 1, "
+                "owner = :owner, lease_expires = :expires WHERE url = ("
+                f"SELECT url FROM image_jobs WHERE {claimable} ORDER BY enqueued_at LIMIT 1"
+                f") AND {claimable} RETURNING url, title, attempts",
+                {"now": now, "owner": self.owner, "expires": now + self.lease},
+            ).fetchone()
+            if job is not None:
+                self._claimed.add(job[0])
+            return job
+
+    def _renew(self) -> None:
+        """Extend leases of jobs this process is still working on."""
+        with self._lock:
+            self._db.executemany(
+                "UPDATE image_jobs SET lease_expires = ? WHERE url = ? AND owner = ?",
+                [(time.time() + self.lease, url, self.owner) for url in self._claimed],
+            )
+
+    def _finish(self, url: str) -> None:
+        """
+        Remove a completed job.
+
+        :param str url: URL of the optimized image.
+        """
+        with self._lock:
+            self._db.execute("DELETE FROM image_jobs WHERE url = ?", (url,))
+            self._claimed.discard(url)
+
+    def _retry(self, url: str, attempts: int) -> None:
+        """
+        Requeue a failed job, or drop it once it has used all of its attempts.
+
+        :param str url: URL of the image which failed to optimize.
+        :param int attempts: Attempts made so far.
+        """
+        with self._lock:
+            if attempts >= self.max_attempts:
+                self._db.execute("DELETE FROM image_jobs WHERE url = ?", (url,))
+            else:
+                self._db.execute(
+                    "UPDATE image_jobs SET status = 'pending', owner = NULL, lease_expires = NULL "
+                    "WHERE url = ? AND owner = ?",
+                    (url, self.owner),
+                )
+            self._claimed.discard(url)
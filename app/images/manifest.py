@@ -0,0 +1,64 @@
+"""Track generated image variants so batch jobs only process new or changed images."""
+
+from typing import List
+
+from google.cloud.storage.blob import Blob
+from sqlalchemy.orm import Session
+
+from clients import images
+from clients.inventory import ImageInventory
+from database.crud import get_image_manifests, save_image_manifests
+from log import LOGGER
+
+
+def stale_images(db: Session, image_blobs: List[Blob], inventory: ImageInventory) -> List[Blob]:
+    """
+    Filter source images down to those which are new, have changed, or are missing variants.
+
+    Variants of images whose generation has changed are dropped from `inventory` so they get regenerated.
+
+    :param Session db: ORM database session.
+    :param List[Blob] image_blobs: Standard-res source images.
+    :param ImageInventory inventory: Listing of the folder containing `image_blobs`.
+
+    :returns: List[Blob]
+    """
+    manifests = get_image_manifests(db, (image_blob.name for image_blob in image_blobs))
+    stale = []
+    for image_blob in image_blobs:
+        manifest = manifests.get(image_blob.name)
+        variant_blob_names = images.variant_blob_names(image_blob)
+        if manifest is not None and manifest.generation != image_blob.generation:
+            for variant_blob_name in variant_blob_names.values():
+                inventory.discard(variant_blob_name)
+        elif manifest is not None and set(variant_blob_names) <= set(manifest.variants or []):
+            continue
+        stale.append(image_blob)
+    LOGGER.info(f"{len(stale)} of {len(image_blobs)} images are new or changed since the last run.")
+    return stale
+
+
+def record_variants(db: Session, image_blobs: List[Blob], inventory: ImageInventory) -> int:
+    """
+    Save the generation of each source image along with the variants which now exist for it.
+
+    :param Session db: ORM database session.
+    :param List[Blob] image_blobs: Standard-res source images which were processed.
+    :param ImageInventory inventory: Listing of the folder, updated with newly created variants.
+
+    :returns: int
+    """
+    manifests = [
+        {
+            "blob_name": image_blob.name,
+            "generation": image_blob.generation,
+            "md5_hash": image_blob.md5_hash,
+            "variants": sorted(
+                variant
+                for variant, variant_blob_name in images.variant_blob_names(image_blob).items()
+                if variant_blob_name in inventory or inventory.is_skipped(variant_blob_name)
+            ),
+        }
+        for image_blob in image_blobs
+    ]
+    return save_image_manifests(db, manifests)
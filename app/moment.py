@@ -15,6 +15,17 @@ def get_current_time() -> str:
     return f'{now.strftime("%Y-%m-%dT%H:%M:%S")}.000Z'
 
 
+def to_ghost_time(timestamp: datetime) -> str:
+    """
+    Format a UTC datetime the way Ghost expects `updated_at` values.
+
+    :param datetime timestamp: UTC datetime to format.
+
+    :returns: str
+    """
+    return f'{timestamp.strftime("%Y-%m-%dT%H:%M:%S")}.000Z'
+
+
 def get_start_date_range(duration: int) -> str:
     """
     Calculate start date of a date range, given a number of days.
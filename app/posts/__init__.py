@@ -1,7 +1,7 @@
 """Enrich post metadata."""
 
+import asyncio
 from datetime import datetime, timedelta
-from time import sleep
 
 from fastapi import APIRouter
 from fastapi.exceptions import HTTPException
@@ -10,7 +10,7 @@ from fastapi.responses import JSONResponse
 from app.moment import get_current_datetime, get_current_time
 from app.posts.metadata import optimize_posts_metadata
 from app.posts.update import update_html_ssl_urls, update_metadata_images
-from clients import ghost
+from clients import ghost, ghost_async, ghost_index
 from database.schemas import PostBulkUpdate, PostUpdate
 from log import LOGGER
 
@@ -60,12 +60,15 @@ async def update_post(post_update: PostUpdate) -> JSONResponse:
         body = update_html_ssl_urls(html, body, slug)
     if feature_image is not None:
         body = update_metadata_images(feature_image, body, slug)
-    sleep(1)
+    await asyncio.sleep(1)
     time = get_current_time()
     body["posts"][0]["updated_at"] = time
-    response, code = ghost.update_post(post.id, body, post.slug)
+    response = await ghost_async.update_post(post.id, body, post.slug)
+    if response is None:
+        raise HTTPException(status_code=502, detail=f"Failed to update post `{slug}`.")
+    ghost_index.upsert(response["posts"][0])
     LOGGER.success(f"Successfully updated post `{slug}`: {body}")
-    return JSONResponse({str(code): response})
+    return JSONResponse({"200": response})
 
 
 @router.get(
@@ -80,7 +83,7 @@ async def batch_update_metadata() -> JSONResponse:
 
     :returns: JSONResponse
     """
-    posts_metadata_updated, posts_metadata_added = optimize_posts_metadata()
+    posts_metadata_updated, posts_metadata_added = await optimize_posts_metadata()
     return JSONResponse(
         content=f"Inserted {posts_metadata_added}; Updated {posts_metadata_updated}",
         status_code=200,
@@ -3,25 +3,34 @@
 from typing import Tuple
 
 from app.posts.update import bulk_update_post_metadata
-from config import settings
-from database import ghost_db
-from database.read_sql import collect_sql_queries
+from database import ColumnRewrite, ghost_async_db, queries, rewrites
+from database.async_db import record_to_dict
 from log import LOGGER
 
+# Post update queries which write the same column & must not run concurrently.
+POST_UPDATE_QUERY_GROUPS = (("unpublish_posts_missing_excerpt", "unpublish_posts_missing_feature_image"),)
 
-def optimize_posts_metadata() -> Tuple[int, int]:
+# Rewrites of large post bodies, applied in chunks so Ghost's own writes aren't blocked.
+POST_CONTENT_REWRITES = (
+    ColumnRewrite("secure_links_html", "posts", "html", "http://", "https://"),
+    ColumnRewrite("secure_links_mobiledoc", "posts", "mobiledoc", "http://", "https://"),
+    ColumnRewrite("secure_links_plaintext", "posts", "plaintext", "http://", "https://"),
+)
+
+
+async def optimize_posts_metadata() -> Tuple[int, int]:
     """
     Bulk optimize metadata for blog posts with incorrect or missing data.
 
     :returns: Tuple[int, int]
     """
-    post_update_queries = collect_sql_queries("posts/updates")
-    posts_metadata_updated = update_posts_metadata(post_update_queries)
-    posts_metadata_added = insert_posts_metadata()
+    post_update_queries = queries.collection("posts/updates")
+    posts_metadata_updated = await update_posts_metadata(post_update_queries)
+    posts_metadata_added = await insert_posts_metadata()
     return posts_metadata_updated, posts_metadata_added
 
 
-def update_posts_metadata(post_update_queries: dict) -> int:
+async def update_posts_metadata(post_update_queries: dict) -> int:
     """
     Update posts with mismatched metadata.
 
@@ -29,24 +38,28 @@ def update_posts_metadata(post_update_queries: dict) -> int:
 
     :returns: int
     """
-    update_results = ghost_db.execute_queries(post_update_queries)
-    if update_results:
-        LOGGER.success(f"Updated metadata for {len(update_results)} posts.")
-        return len(update_results)
-    return 0
+    update_results = await ghost_async_db.execute_queries(post_update_queries, groups=POST_UPDATE_QUERY_GROUPS)
+    posts_updated = sum(result.get("rowcount", 0) for result in update_results.values())
+    for rewrite in POST_CONTENT_REWRITES:
+        try:
+            posts_updated += (await rewrites.run(rewrite))["rows"]
+        except Exception as e:
+            LOGGER.error(f"Failed to rewrite `{rewrite.name}`; it will resume from its last checkpoint: {e}")
+    if posts_updated:
+        LOGGER.success(f"Updated metadata for {posts_updated} posts.")
+    return posts_updated
 
 
-def insert_posts_metadata() -> int:
+async def insert_posts_metadata() -> int:
     """
     Insert metadata for all posts which are missing fields.
 
     :returns: int
     """
-    insert_posts = ghost_db.execute_query_from_file(
-        f"{settings.BASE_DIR}/database/queries/posts/selects/missing_all_metadata.sql",
-    )
-    insert_results = bulk_update_post_metadata(insert_posts)
-    if insert_results:
-        LOGGER.success(f"Inserted metadata for {len(insert_results)} posts.")
-        return insert_results
-    return 0
+    insert_posts = await ghost_async_db.fetch_all(queries["posts/selects/missing_all_metadata"])
+    if insert_posts is None:
+        return 0
+    insert_report = await bulk_update_post_metadata([record_to_dict(row) for row in insert_posts])
+    if insert_report["updated"]:
+        LOGGER.success(f"Inserted metadata for {insert_report['updated']} posts ({insert_report['failed']} failed).")
+    return insert_report["updated"]
@@ -1,21 +1,67 @@
 """Test reading data directly form SQL databases."""
 
-from database.read_sql import collect_sql_queries, fetch_sql_files, parse_sql_batch
-from database.sql_db import Database
+import os
+
+from sqlalchemy.sql.elements import TextClause
+
+from app.posts.metadata import POST_UPDATE_QUERY_GROUPS
+from app.tags import TAG_QUERY_GROUPS
+from config import settings
+from database.registry import QueryRegistry
+from database.sql_db import Database, failed_queries, lane_failure, query_lanes
 from log import LOGGER
 
+QUERIES_DIR = f"{settings.BASE_DIR}/database/queries"
+
+
+def test_registry_loads_sql_files():
+    """Every local `.sql` file is compiled once & addressable as `subdirectory/name`."""
+    queries = QueryRegistry(QUERIES_DIR)
+    assert "analytics/weekly" in queries
+    assert isinstance(queries["posts/selects/get_comments"], TextClause)
+    assert queries.by_digest(queries.get("analytics/weekly").digest).name == "analytics/weekly"
+
+
+def test_registry_collection():
+    """Collections compile every file of a subdirectory, keyed by the names which query groups refer to."""
+    registry = QueryRegistry(QUERIES_DIR)
+    for subdirectory, groups in (
+        ("posts/updates", POST_UPDATE_QUERY_GROUPS),
+        ("tags", TAG_QUERY_GROUPS),
+        ("users", ()),
+    ):
+        files = {name[: -len(".sql")] for name in os.listdir(f"{QUERIES_DIR}/{subdirectory}") if name.endswith(".sql")}
+        collection = registry.collection(subdirectory)
+        assert set(collection) == files
+        assert {name for group in groups for name in group} <= files
+        for name, statement in collection.items():
+            assert isinstance(statement, TextClause)
+            assert str(statement.compile()) == registry.sql(f"{subdirectory}/{name}")
+            assert statement.compile().params == {}, f"`{subdirectory}/{name}` expects unbound parameters."
 
-def test_fetch_sql_files():
-    """Get local SQL files containing DB queries."""
-    files = fetch_sql_files("analytics")
-    assert files is not None
-    assert files[0].split(".")[1] == "sql"
 
+def test_registry_bind_params(tmp_path):
+    """Named parameters in `.sql` files become bind parameters of the compiled statement."""
+    (tmp_path / "tags").mkdir()
+    (tmp_path / "tags" / "select.sql").write_text("SELECT id FROM tags WHERE slug = :slug;", encoding="utf-8")
+    statement = QueryRegistry(str(tmp_path)).collection("tags")["select"]
+    assert statement.compile().params == {"slug": None}
+    assert statement.bindparams(slug="python").compile().params == {"slug": "python"}
 
-def test_collect_sql_queries():
-    """Structure dict of SQL queries to be run (k,v where k is `filename` and v is `query`)."""
-    queries = collect_sql_queries("analytics")
-    assert isinstance(queries, dict)
+
+def test_registry_hot_reload(tmp_path):
+    """Edited & added files are only picked up when hot reloading is enabled."""
+    (tmp_path / "tags").mkdir()
+    sql_file = tmp_path / "tags" / "select.sql"
+    sql_file.write_text("SELECT 1;", encoding="utf-8")
+    static, reloading = QueryRegistry(str(tmp_path)), QueryRegistry(str(tmp_path), hot_reload=True)
+    sql_file.write_text("SELECT 2;", encoding="utf-8")
+    os.utime(sql_file, (0, 0))
+    (tmp_path / "tags" / "update.sql").write_text("UPDATE tags SET slug = slug;", encoding="utf-8")
+    assert static.sql("tags/select") == "SELECT 1;"
+    assert reloading.sql("tags/select") == "SELECT 2;"
+    assert set(static.collection("tags")) == {"select"}
+    assert set(reloading.collection("tags")) == {"select", "update"}
 
 
 def test_select_query(ghost_db: Database):
@@ -24,12 +70,34 @@ def test_select_query(ghost_db: Database):
 
     :param Database ghost_db: Ghost database client.
     """
-    posts_sql = fetch_sql_files("posts/selects")
-    print(f"posts_sql = {posts_sql}")
-    parsed_posts_sql = parse_sql_batch(posts_sql)
-    print(f"parsed_posts_sql = {parsed_posts_sql}")
-    query_result = ghost_db.execute_query(parsed_posts_sql[0])
-    print(f"query_result = {query_result}")
+    posts_sql = QueryRegistry(QUERIES_DIR).collection("posts/selects")
+    query_result = ghost_db.execute_query(posts_sql["get_comments"])
     assert len(posts_sql) > 0
-    assert isinstance(parsed_posts_sql[0], str)
     LOGGER.debug(query_result.rowcount)
+
+
+def test_query_lanes():
+    """Grouped & numbered queries share an ordered lane; everything else runs in a lane of its own."""
+    names = [
+        "feature_image_cdn_urls_2",
+        "title_escape_quotes",
+        "feature_image_cdn_urls_1",
+        "unpublish_b",
+        "unpublish_a",
+    ]
+    lanes = query_lanes(names, groups=[("unpublish_a", "unpublish_b", "missing_query")])
+    assert lanes == [
+        ["unpublish_a", "unpublish_b"],
+        ["feature_image_cdn_urls_1", "feature_image_cdn_urls_2"],
+        ["title_escape_quotes"],
+    ]
+
+
+def test_failed_queries():
+    """Queries of a rolled-back lane are reported as failed alongside the query which raised."""
+    results = {"title_escape_quotes": {"rowcount": 3, "seconds": 0.01}}
+    results.update(lane_failure(["unpublish_a", "unpublish_b"], "unpublish_a", RuntimeError("Lock wait timeout")))
+    assert failed_queries(results) == {
+        "unpublish_a": "Lock wait timeout",
+        "unpublish_b": "Rolled back after `unpublish_a` failed.",
+    }
@@ -0,0 +1,32 @@
+"""Test concurrent updates of Ghost post metadata."""
+
+import asyncio
+
+import httpx
+
+from app.posts import update
+
+
+def test_bulk_update_isolates_unexpected_errors(monkeypatch):
+    """An unexpected error updating one post is recorded against it without aborting the others."""
+    posts = [
+        {"id": post_id, "title": "Title", "custom_excerpt": "Excerpt", "slug": post_id, "updated_at": "2021-09-02"}
+        for post_id in ("ok", "broken")
+    ]
+
+    async def request(method: str, path: str, **kwargs) -> httpx.Response:
+        if "broken" in path:
+            raise ValueError("malformed payload")
+        return httpx.Response(200, json={"posts": []}, request=httpx.Request(method, f"https://ghost.test{path}"))
+
+    monkeypatch.setattr(update.ghost_async, "request", request)
+    results = asyncio.run(update.bulk_update_post_metadata(posts))
+    assert results["updated"] == 1
+    assert results["failed"] == 1
+    assert results["posts"][1] == {
+        "id": "broken",
+        "slug": "broken",
+        "status": "failed",
+        "attempts": 1,
+        "error": "Unexpected exception: malformed payload",
+    }
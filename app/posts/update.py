@@ -1,12 +1,19 @@
 """Methods for updating Ghost post content or metadata."""
 
+import asyncio
+from datetime import datetime
 from typing import List, Optional, Tuple
 
-from fastapi import HTTPException
+import httpx
 
-from clients import ghost
+from app.moment import to_ghost_time
+from clients import ghost, ghost_async
+from config import settings
 from log import LOGGER
 
+# Post fields read when building metadata updates; everything else Ghost would return is discarded.
+POST_METADATA_FIELDS = "id,title,custom_excerpt,slug,updated_at"
+
 
 def update_mobiledoc(post_id: str, mobiledoc: str) -> Tuple[str, int]:
     """
@@ -17,52 +24,129 @@ def update_mobiledoc(post_id: str, mobiledoc: str) -> Tuple[str, int]:
 
     :returns: Tuple[str, int]
     """
-    ghost_post = ghost.get_post(post_id)
+    ghost_post = ghost.get_post(post_id, fields="id,slug,status,updated_at", formats=None, include=None)
     body = {
         "posts": [
             {
                 "mobiledoc": mobiledoc,
-                "status": ghost_post.status,
-                "updated_at": ghost_post.updated_at,
+                "status": ghost_post["status"],
+                "updated_at": ghost_post["updated_at"],
             }
         ]
     }
     return ghost.update_post(ghost_post["id"], body, ghost_post["slug"])
 
 
-def bulk_update_post_metadata(post_dicts: List[Optional[dict]]) -> List[Optional[dict]]:
+# Attempts per post when Ghost rejects an update because the post changed since it was read (409).
+MAX_CONFLICT_ATTEMPTS = 3
+
+
+async def bulk_update_post_metadata(
+    post_dicts: List[Optional[dict]],
+    max_workers: int = settings.GHOST_BULK_WORKERS,
+) -> dict:
     """
-    Update Ghost posts with bad or missing metadata (if applicable).
+    Concurrently update Ghost posts with bad or missing metadata (if applicable).
+
+    Rows which already carry `title`, `custom_excerpt`, `slug` & `updated_at` (ie: from SQL) are
+    used as-is; rows containing only an `id` are fetched from Ghost first.
 
     :param List[Optional[dict]] post_dicts: Ghost posts as list of dictionaries.
+    :param int max_workers: Maximum number of posts being updated at once.
+
+    :returns: dict
+    """
+    post_rows = [post_dict for post_dict in post_dicts if post_dict]
+    if not post_rows:
+        LOGGER.warning("No posts found to update metadata.")
+        return {"updated": 0, "failed": 0, "posts": []}
+    semaphore = asyncio.Semaphore(max_workers)
+    results = await asyncio.gather(*[update_post_metadata(post_row, semaphore) for post_row in post_rows])
+    updated = [result for result in results if result["status"] == "updated"]
+    failed = [result for result in results if result["status"] == "failed"]
+    for result in failed:
+        LOGGER.error(f"Failed to update metadata for post `{result['slug'] or result['id']}`: {result['error']}")
+    return {"updated": len(updated), "failed": len(failed), "posts": results}
+
+
+async def update_post_metadata(post_row: dict, semaphore: asyncio.Semaphore) -> dict:
+    """
+    Populate metadata for a single post, re-reading `updated_at` and retrying only if Ghost reports a conflict.
+
+    :param dict post_row: Ghost post containing at least an `id`.
+    :param asyncio.Semaphore semaphore: Bounds the number of posts updated concurrently.
 
-    :returns: List[Optional[dict]]
+    :returns: dict
+    """
+    post_id = post_row["id"]
+    result = {"id": post_id, "slug": post_row.get("slug"), "status": "failed", "attempts": 0, "error": None}
+    async with semaphore:
+        try:
+            post = post_row
+            if any(field not in post_row for field in POST_METADATA_FIELDS.split(",")):
+                post = await fetch_post_fields(post_id, POST_METADATA_FIELDS)
+            result["slug"] = post["slug"]
+            body = build_metadata_body(post)
+            for attempt in range(MAX_CONFLICT_ATTEMPTS):
+                result["attempts"] = attempt + 1
+                resp = await ghost_async.request("PUT", f"/posts/{post_id}/", json=body)
+                if resp.status_code != 409 or attempt + 1 == MAX_CONFLICT_ATTEMPTS:
+                    break
+                await asyncio.sleep(ghost_async.retry_delay(attempt))
+                refreshed = await fetch_post_fields(post_id, "updated_at")
+                body["posts"][0]["updated_at"] = refreshed["updated_at"]
+            resp.raise_for_status()
+            result["status"] = "updated"
+            LOGGER.success(f"Successfully updated metadata for post `{post['slug']}`")
+        except httpx.HTTPStatusError as e:
+            result["error"] = f"{e.response.status_code}: {e.response.text}"
+        except httpx.HTTPError as e:
+            result["error"] = f"Request failed: {e}"
+        except LookupError as e:
+            result["error"] = f"Missing field in Ghost response: {e}"
+        except Exception as e:
+            result["error"] = f"Unexpected exception: {e}"
+    return result
+
+
+async def fetch_post_fields(post_id: str, fields: str) -> dict:
     """
-    try:
-        if bool(post_dicts):
-            updated_posts = []
-            for post_dict in post_dicts:
-                post = ghost.get_post(post_dict["id"])
-                body = {
-                    "posts": [
-                        {
-                            "meta_title": post["title"],
-                            "og_title": post["title"],
-                            "twitter_title": post["title"],
-                            "meta_description": post["custom_excerpt"],
-                            "twitter_description": post["custom_excerpt"],
-                            "og_description": post["custom_excerpt"],
-                            "updated_at": post["updated_at"],
-                        }
-                    ]
-                }
-                post = ghost.update_post(post_dict["id"], body, post["slug"])
-                if post:
-                    updated_posts.append(post)
-            return updated_posts
-        raise HTTPException(status_code=422, detail="No posts found to update metadata.")
-    except Exception as e:
-        LOGGER.error(f"Error updating metadata: {e}")
+    Fetch a subset of fields for a single Ghost post.
+
+    :param str post_id: ID of post to fetch.
+    :param str fields: Comma-separated post fields to return.
+
+    :returns: dict
+    """
+    resp = await ghost_async.request("GET", f"/posts/{post_id}/", params={"fields": fields})
+    resp.raise_for_status()
+    return resp.json()["posts"][0]
+
+
+def build_metadata_body(post: dict) -> dict:
+    """
+    Build Ghost update payload copying a post's title & excerpt into its SEO metadata.
+
+    :param dict post: Ghost post containing `title`, `custom_excerpt` & `updated_at`.
+
+    :returns: dict
+    """
+    updated_at = post["updated_at"]
+    if isinstance(updated_at, datetime):
+        updated_at = to_ghost_time(updated_at)
+    return {
+        "posts": [
+            {
+                "meta_title": post["title"],
+                "og_title": post["title"],
+                "twitter_title": post["title"],
+                "meta_description": post["custom_excerpt"],
+                "twitter_description": post["custom_excerpt"],
+                "og_description": post["custom_excerpt"],
+                "updated_at": updated_at,
+            }
+        ]
+    }
 
 
 def update_html_ssl_urls(html: str, body: dict, slug: str) -> dict:
@@ -3,13 +3,24 @@
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
 
-from database import ghost_db
-from database.read_sql import collect_sql_queries
+from database import ghost_async_db, queries
 from database.schemas import TagUpdate
+from database.sql_db import failed_queries
 from log import LOGGER
 
 router = APIRouter(prefix="/tags", tags=["tags"])
 
+# Tag queries which must run in order: CDN URLs are rewritten before images are copied into `og_image`/`twitter_image`.
+TAG_QUERY_GROUPS = (
+    (
+        "tags_featureimage_cdn_urls",
+        "tags_ogimage_cdn_urls",
+        "tags_twitterimage_cdn_urls",
+        "tags_meta_og_image",
+        "tags_meta_twitter_image",
+    ),
+)
+
 
 @router.post(
     "/",
@@ -22,7 +33,11 @@ async def update_tags_metadata(tag_update: TagUpdate) -> JSONResponse:
 
     :returns: JSONResponse
     """
-    tag_update_queries = collect_sql_queries("tags")
-    update_results = ghost_db.execute_queries(tag_update_queries)
+    tag_update_queries = queries.collection("tags")
+    update_results = await ghost_async_db.execute_queries(tag_update_queries, groups=TAG_QUERY_GROUPS)
+    failed = failed_queries(update_results)
+    if failed:
+        LOGGER.error(f"Failed to update metadata of tag `{tag_update.current.slug}`: {failed}")
+        return JSONResponse(update_results, status_code=500 if len(failed) == len(update_results) else 207)
     LOGGER.success(f"Tag `{tag_update.current.slug}` updated; updated tag page metadata: {update_results}")
     return JSONResponse(update_results, status_code=200)
@@ -3,8 +3,9 @@
 from github import Github
 from google.cloud import bigquery
 
-from clients.ghost import Ghost
-from clients.img import ImageTransformer
+from clients.ghost import AsyncGhost, Ghost
+from clients.ghost_index import GhostIndex
+from clients.img import DEFAULT_VARIANTS, ImageTransformer, modern_format_variants
 from clients.mail import Mailgun
 from clients.sms import Twilio
 from config import settings
@@ -15,6 +16,11 @@ images = ImageTransformer(
     gcp_api_credentials=settings.GCP_CREDENTIALS,
     bucket_name=settings.GCP_BUCKET_NAME,
     bucket_url=settings.GCP_BUCKET_URL,
+    io_workers=settings.GCP_IMAGE_IO_WORKERS,
+    cpu_workers=settings.GCP_IMAGE_CPU_WORKERS or None,
+    image_timeout=settings.GCP_IMAGE_TIMEOUT,
+    variants=DEFAULT_VARIANTS + modern_format_variants(settings.GCP_IMAGE_QUALITY_PRESET, avif=settings.GCP_IMAGE_AVIF),
+    cache_control=settings.GCP_IMAGE_CACHE_CONTROL,
 )
 
 # Ghost Admin Client
@@ -25,6 +31,32 @@ ghost = Ghost(
     client_id=settings.GHOST_CLIENT_ID,
     client_secret=settings.GHOST_ADMIN_API_KEY,
     content_api_key=settings.GHOST_CONTENT_API_KEY,
+    pool_size=settings.GHOST_HTTP_POOL_SIZE,
+    keepalive_expiry=settings.GHOST_HTTP_KEEPALIVE_EXPIRY,
+    http2=settings.GHOST_HTTP2,
+)
+
+# Ghost Admin Client (async)
+ghost_async = AsyncGhost(
+    admin_api_url=settings.GHOST_ADMIN_API_URL,
+    api_version=settings.GHOST_API_VERSION,
+    content_api_url=settings.GHOST_CONTENT_API_URL,
+    client_id=settings.GHOST_CLIENT_ID,
+    client_secret=settings.GHOST_ADMIN_API_KEY,
+    content_api_key=settings.GHOST_CONTENT_API_KEY,
+    pool_size=settings.GHOST_HTTP_POOL_SIZE,
+    keepalive_expiry=settings.GHOST_HTTP_KEEPALIVE_EXPIRY,
+    http2=settings.GHOST_HTTP2,
+    rate_limit=settings.GHOST_RATE_LIMIT,
+    max_retries=settings.GHOST_MAX_RETRIES,
+)
+
+# Cached index of Ghost posts & pages
+ghost_index = GhostIndex(
+    ghost,
+    ttl=settings.GHOST_INDEX_TTL,
+    max_size=settings.GHOST_INDEX_MAX_SIZE,
+    sync_interval=settings.GHOST_INDEX_SYNC_INTERVAL,
 )
 
 # Twilio SMS
@@ -1,14 +1,76 @@
 """Google Cloud Storage client and image transformer."""
 
-import re
-from typing import Iterator, Tuple
+import threading
+from functools import lru_cache, partial, wraps
+from operator import methodcaller
+from typing import Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import unquote, urlparse
 
+from google.api_core.exceptions import Unauthorized
+from google.auth.exceptions import RefreshError
 from google.cloud import storage
 from google.cloud.storage.blob import Blob
 from google.cloud.storage.client import Bucket, Client
 
 from log import LOGGER
 
+# Maximum number of operations sent in a single GCS batch request.
+BATCH_SIZE = 100
+
+# Errors raised when GCS credentials expire or are revoked; fixed by rebuilding the client.
+AUTH_ERRORS = (RefreshError, Unauthorized)
+
+# Hosts serving objects of any bucket with the bucket name as the first path segment.
+GCS_PATH_STYLE_HOSTS = ("storage.googleapis.com", "storage.cloud.google.com")
+
+
+@lru_cache(maxsize=4096)
+def url_to_blob_path(url: str, bucket_name: str, bucket_url: str) -> Optional[str]:
+    """
+    Map a public CDN, `storage.googleapis.com` or `gs://` URL to the path of an object in a bucket.
+
+    :param str url: URL of an object.
+    :param str bucket_name: Name of the bucket the object must belong to.
+    :param str bucket_url: Public CDN URL the bucket is served from.
+
+    :returns: Optional[str]
+    """
+    parsed = urlparse(url)
+    host, path = parsed.netloc.lower(), unquote(parsed.path)
+    cdn = urlparse(bucket_url if "//" in bucket_url else f"//{bucket_url}")
+    cdn_prefix = cdn.path.rstrip("/")
+    if host == cdn.netloc.lower() and path.startswith(f"{cdn_prefix}/"):
+        path = path[len(cdn_prefix) :]
+    elif host in GCS_PATH_STYLE_HOSTS or parsed.scheme == "gs":
+        if parsed.scheme != "gs":
+            host, _, path = path.lstrip("/").partition("/")
+        if host != bucket_name:
+            return None
+    elif host != f"{bucket_name}.storage.googleapis.com":
+        return None
+    return path.lstrip("/") or None
+
+
+def refresh_on_auth_error(method: Callable) -> Callable:
+    """
+    Retry a GCS call once with a freshly built client & bucket if authorization fails.
+
+    :param Callable method: Method of a `GCS` instance.
+
+    :returns: Callable
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except AUTH_ERRORS as e:
+            LOGGER.warning(f"GCS authorization failed during `{method.__name__}`; rebuilding client: {e}")
+            self.reset()
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
 
 class GCS:
     """Google Cloud Storage image CDN."""
@@ -24,27 +86,45 @@ class GCS:
         self.gcp_api_credentials = gcp_api_credentials
         self.bucket_name = bucket_name
         self.bucket_url = bucket_url
+        self._client: Optional[Client] = None
+        self._bucket: Optional[Bucket] = None
+        self._lock = threading.Lock()
 
     @property
     def client(self) -> Client:
         """
-        Google Cloud Storage client.
+        Google Cloud Storage client, created once per process and shared across threads.
 
         :returns: Client
         """
-        return storage.Client(
-            project=self.gcp_project_name,
-            credentials=self.gcp_api_credentials,
-        )
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = storage.Client(
+                        project=self.gcp_project_name,
+                        credentials=self.gcp_api_credentials,
+                    )
+        return self._client
 
     @property
     def bucket(self) -> Bucket:
         """
-        Google Cloud Storage bucket where images are stored.
+        Google Cloud Storage bucket where images are stored, fetched once per process.
 
         :returns: Bucket
         """
-        return self.client.get_bucket(self.bucket_name)
+        if self._bucket is None:
+            client = self.client
+            with self._lock:
+                if self._bucket is None:
+                    self._bucket = client.get_bucket(self.bucket_name)
+        return self._bucket
+
+    def reset(self) -> None:
+        """Discard the cached client & bucket so they are rebuilt on next access."""
+        with self._lock:
+            self._client = None
+            self._bucket = None
 
     @property
     def bucket_http_url(self) -> str:
@@ -55,24 +135,143 @@ class GCS:
         """
         return self.bucket_url
 
-    def get(self, prefix: str) -> Iterator:
+    def blob_from_url(self, url: str) -> Optional[Blob]:
+        """
+        Reference the blob served at a CDN or GCS URL, without making a request.
+
+        :param str url: URL of an image (ie: `https://cdn.example.com/2021/04/image.jpg`).
+
+        :returns: Optional[Blob]
+        """
+        blob_path = url_to_blob_path(url, self.bucket_name, self.bucket_http_url)
+        if blob_path is None:
+            LOGGER.warning(f"`{url}` is not served from bucket `{self.bucket_name}`.")
+            return None
+        return self.bucket.blob(blob_path)
+
+    @refresh_on_auth_error
+    def get(self, prefix: str) -> List[Blob]:
         """
         Retrieve all blobs in a bucket containing a prefix.
 
         :param str prefix: Substring to match against filenames.
 
-        :returns: Iterator
+        :returns: List[Blob]
         """
-        return self.client.list_blobs(self.bucket, prefix=prefix)
+        return list(self.client.list_blobs(self.bucket, prefix=prefix))
 
-    def _remove_repeat_blobs(self, image_blobs):
-        images_purged = []
-        r = re.compile("-[0-9]-[0-9]@2x.jpg")
-        repeat_blobs = list(filter(r.match, image_blobs))
-        for repeat_blob in repeat_blobs:
-            self.bucket.delete_blob(repeat_blob)
-            images_purged.append(repeat_blob)
-            LOGGER.info(f"Deleted {repeat_blob}")
+    def _batch(self, operations: List[Tuple[str, Callable[[Bucket], None]]]) -> Dict[str, Optional[str]]:
+        """
+        Send operations to GCS in batch requests of up to `BATCH_SIZE` operations each.
+
+        A chunk whose request fails authorization is sent once more with a freshly built client & bucket.
+
+        :param List[Tuple[str, Callable[[Bucket], None]]] operations: Blob name paired with the bucket call to batch.
+
+        :returns: Dict[str, Optional[str]]
+        """
+        results = {}
+        for i in range(0, len(operations), BATCH_SIZE):
+            chunk = operations[i : i + BATCH_SIZE]
+            for attempt in range(2):
+                try:
+                    bucket = self.bucket
+                    with self.client.batch(raise_exception=False) as batch:
+                        for _, operation in chunk:
+                            operation(bucket)
+                    for (blob_name, _), response in zip(chunk, batch._responses):
+                        results[blob_name] = None if 200 <= response.status_code < 300 else self._batch_error(response)
+                    break
+                except AUTH_ERRORS as e:
+                    if attempt == 0:
+                        LOGGER.warning(f"GCS authorization failed during batch request; rebuilding client: {e}")
+                        self.reset()
+                        continue
+                    LOGGER.error(f"GCS batch request of {len(chunk)} operations failed authorization: {e}")
+                    results.update({blob_name: str(e) for blob_name, _ in chunk})
+                except Exception as e:
+                    LOGGER.error(f"GCS batch request of {len(chunk)} operations failed: {e}")
+                    results.update({blob_name: str(e) for blob_name, _ in chunk})
+                    break
+        return results
+
+    @staticmethod
+    def _batch_error(response) -> str:
+        """
+        Describe a failed operation within a batch request.
+
+        :param requests.Response response: Response to a single operation of a batch request.
+
+        :returns: str
+        """
+        try:
+            return f"{response.status_code}: {response.json()['error']['message']}"
+        except (ValueError, KeyError, TypeError):
+            return f"{response.status_code}: {response.reason}"
+
+    def delete_blobs(self, blob_names: List[str]) -> Tuple[List[str], Dict[str, str]]:
+        """
+        Delete blobs using batch requests.
+
+        :param List[str] blob_names: Full paths of blobs to delete.
+
+        :returns: Tuple[List[str], Dict[str, str]]
+        """
+        results = self._batch([(name, methodcaller("delete_blob", name)) for name in blob_names])
+        deleted = [name for name, error in results.items() if error is None]
+        failed = {name: error for name, error in results.items() if error is not None}
+        for name, error in failed.items():
+            LOGGER.error(f"Failed to delete `{name}`: {error}")
+        return deleted, failed
+
+    def copy_blobs(self, copies: List[Tuple[Union[Blob, str], str]]) -> Tuple[List[str], Dict[str, str]]:
+        """
+        Copy blobs within the bucket using batch requests.
+
+        :param List[Tuple[Union[Blob, str], str]] copies: Source blob (or its name) paired with its destination path.
+
+        :returns: Tuple[List[str], Dict[str, str]]
+        """
+        operations = [
+            (new_name, partial(self._copy_operation, source.name if isinstance(source, Blob) else source, new_name))
+            for source, new_name in copies
+        ]
+        results = self._batch(operations)
+        copied = [name for name, error in results.items() if error is None]
+        failed = {name: error for name, error in results.items() if error is not None}
+        for name, error in failed.items():
+            LOGGER.error(f"Failed to copy to `{name}`: {error}")
+        return copied, failed
+
+    @staticmethod
+    def _copy_operation(source_name: str, new_name: str, bucket: Bucket) -> None:
+        """
+        Copy a blob within a bucket; queued as part of a batch request.
+
+        :param str source_name: Full path of blob to copy.
+        :param str new_name: Full path of the copy.
+        :param Bucket bucket: Bucket of the client sending the batch.
+        """
+        bucket.copy_blob(bucket.blob(source_name), bucket, new_name=new_name)
+
+    def move_blobs(self, moves: List[Tuple[Blob, str]]) -> Tuple[List[str], Dict[str, str]]:
+        """
+        Move blobs within the bucket by batch copying them, then batch deleting the sources which copied successfully.
+
+        :param List[Tuple[Blob, str]] moves: Source blob paired with its destination path.
+
+        :returns: Tuple[List[str], Dict[str, str]]
+        """
+        copied, failed = self.copy_blobs(moves)
+        copied_names = set(copied)
+        sources = {new_name: source.name for source, new_name in moves if new_name in copied_names}
+        deleted, delete_failures = self.delete_blobs(list(sources.values()))
+        deleted_names = set(deleted)
+        moved = [new_name for new_name, source_name in sources.items() if source_name in deleted_names]
+        failed.update(
+            {new_name: delete_failures[source] for new_name, source in sources.items() if source in delete_failures}
+        )
+        return moved, failed
 
     @staticmethod
     def _get_folder_and_filename(image_blob: Blob) -> Tuple[str, str]:
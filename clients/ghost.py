@@ -1,17 +1,33 @@
 """Ghost admin client."""
 
-from datetime import datetime as date
-from typing import List, Optional, Tuple, Any
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
+import httpx
 import jwt
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
 
+from clients.ratelimit import AsyncRateLimiter
 from log import LOGGER
 
+# HTTP/2 is only negotiated by `httpx` when the optional `h2` package is installed.
+HTTP2_AVAILABLE = find_spec("h2") is not None
 
-class Ghost:
-    """Ghost admin client."""
+
+class GhostAuth:
+    """Connection settings & admin API token signing shared by the sync and async Ghost clients."""
+
+    # Admin API tokens are signed to expire after five minutes, and are re-signed this many seconds before then.
+    TOKEN_TTL = 5 * 60
+    TOKEN_REFRESH_MARGIN = 30
 
     def __init__(
         self,
@@ -21,9 +37,13 @@ class Ghost:
         content_api_key: str,
         client_id: str,
         client_secret: str,
+        pool_size: int = 20,
+        keepalive_expiry: float = 60.0,
+        http2: bool = True,
+        timeout: float = 20.0,
     ):
         """
-        Ghost Admin API client constructor.
+        Ghost Admin API connection settings.
 
         :param str admin_api_url: Admin URL of self-hosted Ghost API.
         :param int content_api_url: Content URL of self-hosted Ghost API.
@@ -31,6 +51,10 @@ class Ghost:
         :param str content_api_key: Content API key for self-hosted Ghost API.
         :param str client_id: Unique ID of Ghost admin client.
         :param str client_secret: Authentication secret of Ghost admin client.
+        :param int pool_size: Maximum number of pooled connections kept open to Ghost.
+        :param float keepalive_expiry: Seconds an idle pooled connection is kept alive.
+        :param bool http2: Negotiate HTTP/2 for async requests when supported.
+        :param float timeout: Timeout in seconds for requests to Ghost.
         """
         self.admin_api_url = admin_api_url
         self.api_version = api_version
@@ -38,28 +62,138 @@ class Ghost:
         self.content_api_url = content_api_url
         self.secret = client_secret
         self.content_api_key = content_api_key
+        self.pool_size = pool_size
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.timeout = timeout
+        self._secret_bytes: Optional[bytes] = None
+        self._token: Optional[str] = None
+        self._token_refresh_at: float = 0.0
+        self._token_lock = threading.Lock()
+        self.token_stats = {"signed": 0, "reused": 0}
+
+    @property
+    def session_token(self) -> str:
+        """
+        Session token for Ghost admin API.
+
+        Signed tokens are cached and reused until shortly before they expire. Signing never awaits,
+        so the lock (which also guards `token_stats`) is safe to hold from both worker threads and the event loop.
+
+        :returns: str
+        """
+        with self._token_lock:
+            if self._token is not None and time.time() < self._token_refresh_at:
+                self.token_stats["reused"] += 1
+                return self._token
+            return self._sign_token()
+
+    def _sign_token(self) -> str:
+        """
+        Sign a new admin API JWT and cache it.
+
+        :returns: str
+        """
+        if self._secret_bytes is None:
+            self._secret_bytes = bytes.fromhex(self.secret)
+        iat = int(time.time())
+        header = {"alg": "HS256", "typ": "JWT", "kid": self.client_id}
+        payload = {"iat": iat, "exp": iat + self.TOKEN_TTL, "aud": f"/v{self.api_version}/admin/"}
+        token = jwt.encode(payload, self._secret_bytes, algorithm="HS256", headers=header)
+        self._token = token
+        self._token_refresh_at = iat + self.TOKEN_TTL - self.TOKEN_REFRESH_MARGIN
+        self.token_stats["signed"] += 1
+        return token
+
+    @staticmethod
+    def _read_params(fields: Optional[str], formats: Optional[str], include: Optional[str]) -> dict:
+        """
+        Build query parameters projecting which parts of a post Ghost returns.
+
+        :param Optional[str] fields: Comma-separated post fields to return; all fields when omitted.
+        :param Optional[str] formats: Comma-separated content formats (`html`, `mobiledoc`, `plaintext`) to return.
+        :param Optional[str] include: Comma-separated relations (`authors`, `tags`) to embed.
+
+        :returns: dict
+        """
+        params = {}
+        if fields:
+            params["fields"] = fields
+        if formats:
+            params["formats"] = formats
+        if include:
+            params["include"] = include
+        return params
+
+    @staticmethod
+    def _browse_params(limit: int, fields: Optional[str], filter_by: Optional[str]) -> dict:
+        """
+        Build query parameters for a paginated Ghost browse request.
+
+        :param int limit: Number of resources requested per page.
+        :param Optional[str] fields: Comma-separated resource fields to return.
+        :param Optional[str] filter_by: Ghost NQL filter.
+
+        :returns: dict
+        """
+        params = {"limit": limit}
+        if fields:
+            params["fields"] = fields
+        if filter_by:
+            params["filter"] = filter_by
+        return params
+
+
+class Ghost(GhostAuth):
+    """Ghost admin client."""
+
+    def __init__(self, *args, **kwargs):
+        """Ghost Admin API client constructor; accepts all `GhostAuth` arguments."""
+        super().__init__(*args, **kwargs)
+        self._session: Optional[requests.Session] = None
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Keep-alive HTTP session with a connection pool shared by all requests to Ghost.
+
+        :returns: requests.Session
+        """
+        if self._session is None:
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=self.pool_size)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        return self._session
+
+    def close(self) -> None:
+        """Close pooled connections held by the sync session."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
 
     def _https_session(self) -> None:
         """Authorize HTTPS session with Ghost admin."""
         endpoint = f"{self.admin_api_url}/session/"
         headers = {"Authorization": self.session_token}
-        resp = requests.post(endpoint, headers=headers, timeout=20)
+        resp = self.session.post(endpoint, headers=headers, timeout=self.timeout)
         LOGGER.info(f"Authorization resulted in status code {resp.status_code}.")
 
-    @property
-    def session_token(self) -> str:
-        """Generate session token for Ghost admin API."""
-        iat = int(date.now().timestamp())
-        header = {"alg": "HS256", "typ": "JWT", "kid": self.client_id}
-        payload = {"iat": iat, "exp": iat + 5 * 60, "aud": f"/v{self.api_version}/admin/"}
-        token = jwt.encode(payload, bytes.fromhex(self.secret), algorithm="HS256", headers=header)
-        return token
-
-    def get_post(self, post_id: str) -> Optional[dict]:
+    def get_post(
+        self,
+        post_id: str,
+        fields: Optional[str] = None,
+        formats: Optional[str] = "mobiledoc,html",
+        include: Optional[str] = "authors",
+    ) -> Optional[dict]:
         """
         Fetch Ghost post by ID.
 
         :param str post_id: ID of post to fetch.
+        :param Optional[str] fields: Comma-separated post fields to return; all fields when omitted.
+        :param Optional[str] formats: Comma-separated content formats to return.
+        :param Optional[str] include: Comma-separated relations to embed.
 
         :returns: Optional[dict]
         """
@@ -68,16 +202,13 @@ class Ghost:
                 "Authorization": f"Ghost {self.session_token}",
                 "Content-Type": "application/json",
             }
-            params = {
-                "include": "authors",
-                "formats": "mobiledoc,html",
-            }
+            params = self._read_params(fields, formats, include)
             endpoint = f"{self.admin_api_url}/posts/{post_id}/"
-            resp = requests.get(endpoint, headers=headers, params=params, timeout=20)
+            resp = self.session.get(endpoint, headers=headers, params=params, timeout=self.timeout)
             if resp.json().get("errors") is not None and resp.json().get("posts") is not None:
                 LOGGER.error(f"Failed to fetch post `{post_id}`: {resp.json().get('errors')[0]['message']}")
             post = resp.json()["posts"][0]
-            LOGGER.info(f"Fetched Ghost post `{post['slug']}` ({endpoint})")
+            LOGGER.info(f"Fetched Ghost post `{post.get('slug', post_id)}` ({endpoint})")
             return post
         except HTTPError as e:
             LOGGER.error(f"Ghost HTTPError while fetching post `{post_id}`: {e}")
@@ -86,11 +217,20 @@ class Ghost:
         except Exception as e:
             LOGGER.error(f"Unexpected error occurred while fetching post `{post_id}`: {e}")
 
-    def get_post_by_slug(self, post_slug: str) -> Optional[dict]:
+    def get_post_by_slug(
+        self,
+        post_slug: str,
+        fields: Optional[str] = None,
+        formats: Optional[str] = "mobiledoc",
+        include: Optional[str] = "authors",
+    ) -> Optional[dict]:
         """
         Fetch Ghost post by slug.
 
         :param str post_slug: Unique slug of post to fetch.
+        :param Optional[str] fields: Comma-separated post fields to return; all fields when omitted.
+        :param Optional[str] formats: Comma-separated content formats to return.
+        :param Optional[str] include: Comma-separated relations to embed.
 
         :returns: Optional[dict]
         """
@@ -99,14 +239,11 @@ class Ghost:
                 "Authorization": f"Ghost {self.session_token}",
                 "Content-Type": "application/json",
             }
-            params = {
-                "include": "authors",
-                "formats": "mobiledoc",
-            }
+            params = self._read_params(fields, formats, include)
             endpoint = f"{self.admin_api_url}/posts/slug/{post_slug}/"
-            resp = requests.get(endpoint, headers=headers, params=params, timeout=20)
+            resp = self.session.get(endpoint, headers=headers, params=params, timeout=self.timeout)
             post = resp.json()["posts"][0]
-            LOGGER.info(f"Fetched Ghost post `{post['slug']}`")
+            LOGGER.info(f"Fetched Ghost post `{post_slug}`")
             return post
         except HTTPError as e:
             LOGGER.error(f"HTTPError occurred while fetching post `{post_slug}`: {e}")
@@ -115,23 +252,18 @@ class Ghost:
         except Exception as e:
             LOGGER.error(f"Unexpected error occurred while fetching post `{post_slug}`: {e}")
 
-    def get_pages(self) -> Optional[dict]:
+    def get_pages(self, fields: Optional[str] = None) -> Optional[List[dict]]:
         """
-        Fetch Ghost pages.
+        Fetch all Ghost pages.
 
-        :returns: Optional[dict]
+        :param Optional[str] fields: Comma-separated page fields to return; all fields when omitted.
+
+        :returns: Optional[List[dict]]
         """
         try:
-            headers = {
-                "Authorization": f"Ghost {self.session_token}",
-                "Content-Type": "application/json",
-            }
-            endpoint = f"{self.admin_api_url}/pages"
-            resp = requests.get(endpoint, headers=headers, timeout=20)
-            if resp.json().get("errors") is not None:
-                LOGGER.error(f"Failed to fetch Ghost pages: {resp.json().get('errors')[0]['message']}")
-            LOGGER.info(f"Fetched {len(resp.json())} Ghost pages")
-            return resp.json().get("pages")
+            pages = list(self._paginate("pages", self._browse_params(100, fields, None), prefetch=2))
+            LOGGER.info(f"Fetched {len(pages)} Ghost pages")
+            return pages
         except HTTPError as e:
             LOGGER.error(f"Ghost HTTPError while fetching pages: {e}")
         except KeyError as e:
@@ -139,6 +271,96 @@ class Ghost:
         except Exception as e:
             LOGGER.error(f"Unexpected error occurred while fetching pages: {e}")
 
+    def iter_posts(
+        self,
+        limit: int = 100,
+        fields: Optional[str] = None,
+        filter_by: Optional[str] = "type:post",
+        prefetch: int = 2,
+    ) -> Iterator[dict]:
+        """
+        Stream every Ghost post, one page of results at a time.
+
+        :param int limit: Number of posts requested per page.
+        :param Optional[str] fields: Comma-separated post fields to return; all fields when omitted.
+        :param Optional[str] filter_by: Ghost NQL filter applied to posts.
+        :param int prefetch: Number of subsequent pages fetched concurrently ahead of the consumer.
+
+        :returns: Iterator[dict]
+        """
+        params = self._browse_params(limit, fields, filter_by)
+        yield from self._paginate("posts", params, prefetch)
+
+    def iter_pages(
+        self,
+        limit: int = 100,
+        fields: Optional[str] = None,
+        filter_by: Optional[str] = None,
+        prefetch: int = 2,
+    ) -> Iterator[dict]:
+        """
+        Stream every Ghost page, one page of results at a time.
+
+        :param int limit: Number of pages requested per page of results.
+        :param Optional[str] fields: Comma-separated page fields to return; all fields when omitted.
+        :param Optional[str] filter_by: Ghost NQL filter applied to pages.
+        :param int prefetch: Number of subsequent result pages fetched concurrently ahead of the consumer.
+
+        :returns: Iterator[dict]
+        """
+        params = self._browse_params(limit, fields, filter_by)
+        yield from self._paginate("pages", params, prefetch)
+
+    def _fetch_page(self, resource: str, params: dict, page: int) -> dict:
+        """
+        Fetch a single page of a Ghost browse endpoint.
+
+        :param str resource: Ghost resource to browse (`posts` or `pages`).
+        :param dict params: Query parameters shared by every page.
+        :param int page: Page number to fetch.
+
+        :returns: dict
+        """
+        headers = {
+            "Authorization": f"Ghost {self.session_token}",
+            "Content-Type": "application/json",
+        }
+        resp = self.session.get(
+            f"{self.admin_api_url}/{resource}/",
+            headers=headers,
+            params={**params, "page": page},
+            timeout=self.timeout,
+        )
+        resp.raise_for_status()
+        return resp.json()
+
+    def _paginate(self, resource: str, params: dict, prefetch: int) -> Iterator[dict]:
+        """
+        Yield resources from every page of a Ghost browse endpoint, prefetching upcoming pages in threads.
+
+        :param str resource: Ghost resource to browse (`posts` or `pages`).
+        :param dict params: Query parameters shared by every page.
+        :param int prefetch: Number of pages fetched ahead of the consumer.
+
+        :returns: Iterator[dict]
+        """
+        first_page = self._fetch_page(resource, params, 1)
+        yield from first_page[resource]
+        total_pages = first_page["meta"]["pagination"]["pages"]
+        if total_pages <= 1:
+            return
+        executor = ThreadPoolExecutor(max_workers=max(prefetch, 1))
+        try:
+            pending = deque()
+            next_page = 2
+            while next_page <= total_pages or pending:
+                while next_page <= total_pages and len(pending) < max(prefetch, 1):
+                    pending.append(executor.submit(self._fetch_page, resource, params, next_page))
+                    next_page += 1
+                yield from pending.popleft().result()[resource]
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def update_post(self, post_id: str, body: dict, slug: str) -> Optional[dict]:
         """
         Update post by ID.
@@ -150,14 +372,14 @@ class Ghost:
         :returns: Optional[dict]
         """
         try:
-            resp = requests.put(
+            resp = self.session.put(
                 f"{self.admin_api_url}/posts/{post_id}/",
                 json=body,
                 headers={
                     "Authorization": self.session_token,
                     "Content-Type": "application/json",
                 },
-                timeout=20,
+                timeout=self.timeout,
             )
             if resp.status_code != 200:
                 LOGGER.success(f"Successfully updated post `{slug}`")
@@ -179,7 +401,12 @@ class Ghost:
                 "Authorization": f"Ghost {self.session_token}",
                 "Content-Type": "application/json",
             }
-            resp = requests.get(f"{self.admin_api_url}/users", params=params, headers=headers, timeout=20)
+            resp = self.session.get(
+                f"{self.admin_api_url}/users",
+                params=params,
+                headers=headers,
+                timeout=self.timeout,
+            )
             if resp.status_code == 200:
                 return resp.json().get("users")
         except HTTPError as e:
@@ -200,11 +427,11 @@ class Ghost:
             headers = {
                 "Content-Type": "application/json",
             }
-            resp = requests.get(
+            resp = self.session.get(
                 f"{self.content_api_url}/authors/{author_id}/",
                 params=params,
                 headers=headers,
-                timeout=20,
+                timeout=self.timeout,
             )
             if resp.status_code == 200:
                 return resp.json()["authors"]
@@ -222,11 +449,11 @@ class Ghost:
         :returns: Optional[List[str]]
         """
         try:
-            resp = requests.post(
+            resp = self.session.post(
                 f"{self.admin_api_url}/members/",
                 json=body,
                 headers={"Authorization": self.session_token},
-                timeout=20,
+                timeout=self.timeout,
             )
             response = f'Successfully created new Ghost member `{body.get("email")}: {resp.json()}.'
             LOGGER.success(response)
@@ -242,21 +469,274 @@ class Ghost:
         :returns: Optional[List[str]]
         """
         try:
-            headers = {
-                "Authorization": f"Ghost {self.session_token}",
-                "Content-Type": "application/json",
-            }
-            params = {
-                "filter": "type:post",
-            }
-            endpoint = f"{self.admin_api_url}/posts"
-            resp = requests.get(endpoint, headers=headers, params=params, timeout=20)
-            if resp.status_code == 200:
-                posts = resp.json()["posts"]
-                return [post["url"] for post in posts if post["status"] == "published"]
+            posts = self._paginate("posts", self._browse_params(100, "url,status", "type:post"), prefetch=2)
+            return [post["url"] for post in posts if post["status"] == "published"]
         except HTTPError as e:
             LOGGER.error(f"Ghost HTTPError while fetching posts: {e}")
         except KeyError as e:
             LOGGER.error(f"KeyError for `{e}` occurred while fetching posts")
         except Exception as e:
             LOGGER.error(f"Unexpected error occurred while fetching posts: {e}")
+
+
+class AsyncGhost(GhostAuth):
+    """Asynchronous Ghost admin client for use within request handlers."""
+
+    # Responses worth retrying as-is; conflicts (409) need a fresh `updated_at` and are left to the caller.
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        *args,
+        rate_limit: float = 10.0,
+        rate_limit_burst: int = 5,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        **kwargs,
+    ):
+        """
+        Async Ghost Admin API client constructor; accepts all `GhostAuth` arguments.
+
+        :param float rate_limit: Sustained requests per second sent to each Ghost host.
+        :param int rate_limit_burst: Requests per host allowed back-to-back before throttling.
+        :param int max_retries: Retries for throttled (429), failed (5xx) or dropped requests.
+        :param float backoff_factor: Base delay in seconds for exponential backoff between retries.
+        """
+        super().__init__(*args, **kwargs)
+        self.rate_limit = rate_limit
+        self.rate_limit_burst = rate_limit_burst
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self._async_session: Optional[httpx.AsyncClient] = None
+        self._async_session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._rate_limiters: Dict[str, AsyncRateLimiter] = {}
+
+    async def async_session(self) -> httpx.AsyncClient:
+        """
+        Pooled keep-alive async HTTP client, bound to the running event loop.
+
+        A client left over from a previous event loop is closed before it is replaced.
+
+        :returns: httpx.AsyncClient
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_session is not None and self._async_session_loop is not loop:
+            try:
+                await self._async_session.aclose()
+            except RuntimeError as e:
+                LOGGER.warning(f"Could not cleanly close Ghost client of a previous event loop: {e}")
+            self._async_session = None
+        if self._async_session is None or self._async_session.is_closed:
+            self._async_session = httpx.AsyncClient(
+                http2=self.http2,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.pool_size,
+                    max_keepalive_connections=self.pool_size,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+            )
+            self._async_session_loop = loop
+        return self._async_session
+
+    async def aclose(self) -> None:
+        """Close pooled connections held by the async client."""
+        if self._async_session is not None:
+            await self._async_session.aclose()
+            self._async_session = None
+            self._async_session_loop = None
+
+    def _rate_limiter(self, url: str) -> AsyncRateLimiter:
+        """
+        Rate limiter shared by all requests to the host of `url`.
+
+        :param str url: URL of the outbound request.
+
+        :returns: AsyncRateLimiter
+        """
+        host = httpx.URL(url).host
+        if host not in self._rate_limiters:
+            self._rate_limiters[host] = AsyncRateLimiter(self.rate_limit, self.rate_limit_burst)
+        return self._rate_limiters[host]
+
+    def retry_delay(self, attempt: int, resp: Optional[httpx.Response] = None) -> float:
+        """
+        Delay before retrying a request, honoring `Retry-After` when Ghost sends one.
+
+        :param int attempt: Zero-based number of the attempt which failed.
+        :param Optional[httpx.Response] resp: Response of the failed attempt, if any.
+
+        :returns: float
+        """
+        if resp is not None and resp.headers.get("Retry-After", "").isdigit():
+            return float(resp.headers["Retry-After"])
+        return self.backoff_factor * (2**attempt) + random.uniform(0, self.backoff_factor)
+
+    async def request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """
+        Send an authorized, rate-limited request to the Ghost admin API, retrying throttled or failed attempts.
+
+        :param str method: HTTP method.
+        :param str path: Endpoint path relative to the admin API URL (ie: `/posts/{id}/`).
+
+        :returns: httpx.Response
+        """
+        url = f"{self.admin_api_url}{path}"
+        limiter = self._rate_limiter(url)
+        attempt = 0
+        while True:
+            await limiter.acquire()
+            headers = {
+                "Authorization": f"Ghost {self.session_token}",
+                "Content-Type": "application/json",
+            }
+            try:
+                client = await self.async_session()
+                resp = await client.request(method, url, headers=headers, **kwargs)
+            except httpx.TransportError as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self.retry_delay(attempt)
+                LOGGER.warning(f"Ghost {method} `{path}` failed ({e}); retrying in {delay:.2f}s")
+            else:
+                if resp.status_code not in self.RETRY_STATUS_CODES or attempt >= self.max_retries:
+                    return resp
+                delay = self.retry_delay(attempt, resp)
+                LOGGER.warning(f"Ghost {method} `{path}` returned {resp.status_code}; retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get_post(
+        self,
+        post_id: str,
+        fields: Optional[str] = None,
+        formats: Optional[str] = "mobiledoc,html",
+        include: Optional[str] = "authors",
+    ) -> Optional[dict]:
+        """
+        Fetch Ghost post by ID without blocking the event loop.
+
+        :param str post_id: ID of post to fetch.
+        :param Optional[str] fields: Comma-separated post fields to return; all fields when omitted.
+        :param Optional[str] formats: Comma-separated content formats to return.
+        :param Optional[str] include: Comma-separated relations to embed.
+
+        :returns: Optional[dict]
+        """
+        try:
+            params = self._read_params(fields, formats, include)
+            resp = await self.request("GET", f"/posts/{post_id}/", params=params)
+            resp.raise_for_status()
+            post = resp.json()["posts"][0]
+            LOGGER.info(f"Fetched Ghost post `{post.get('slug', post_id)}`")
+            return post
+        except httpx.HTTPStatusError as e:
+            LOGGER.error(f"Ghost HTTPError while fetching post `{post_id}`: {e}")
+        except httpx.HTTPError as e:
+            LOGGER.error(f"Ghost request failed while fetching post `{post_id}`: {e}")
+        except LookupError as e:
+            LOGGER.error(f"LookupError for `{e}` occurred while fetching post `{post_id}`")
+
+    async def update_post(self, post_id: str, body: dict, slug: str) -> Optional[dict]:
+        """
+        Update post by ID without blocking the event loop.
+
+        :param str post_id: Ghost post ID
+        :param dict body: Payload containing post updates.
+        :param str slug: Human-readable unique identifier.
+
+        :returns: Optional[dict]
+        """
+        try:
+            resp = await self.request("PUT", f"/posts/{post_id}/", json=body)
+            resp.raise_for_status()
+            LOGGER.success(f"Successfully updated post `{slug}`")
+            return resp.json()
+        except httpx.HTTPStatusError as e:
+            LOGGER.error(f"HTTPError while updating Ghost post `{slug}`: {e.response.text}")
+        except httpx.HTTPError as e:
+            LOGGER.error(f"Ghost request failed while updating post `{slug}`: {e}")
+
+    async def iter_posts(
+        self,
+        limit: int = 100,
+        fields: Optional[str] = None,
+        filter_by: Optional[str] = "type:post",
+        prefetch: int = 2,
+    ) -> AsyncIterator[dict]:
+        """
+        Stream every Ghost post without blocking the event loop.
+
+        :param int limit: Number of posts requested per page.
+        :param Optional[str] fields: Comma-separated post fields to return; all fields when omitted.
+        :param Optional[str] filter_by: Ghost NQL filter applied to posts.
+        :param int prefetch: Number of subsequent pages fetched concurrently ahead of the consumer.
+
+        :returns: AsyncIterator[dict]
+        """
+        params = self._browse_params(limit, fields, filter_by)
+        async for post in self._apaginate("posts", params, prefetch):
+            yield post
+
+    async def iter_pages(
+        self,
+        limit: int = 100,
+        fields: Optional[str] = None,
+        filter_by: Optional[str] = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[dict]:
+        """
+        Stream every Ghost page without blocking the event loop.
+
+        :param int limit: Number of pages requested per page of results.
+        :param Optional[str] fields: Comma-separated page fields to return; all fields when omitted.
+        :param Optional[str] filter_by: Ghost NQL filter applied to pages.
+        :param int prefetch: Number of subsequent result pages fetched concurrently ahead of the consumer.
+
+        :returns: AsyncIterator[dict]
+        """
+        params = self._browse_params(limit, fields, filter_by)
+        async for page in self._apaginate("pages", params, prefetch):
+            yield page
+
+    async def _afetch_page(self, resource: str, params: dict, page: int) -> dict:
+        """
+        Fetch a single page of a Ghost browse endpoint.
+
+        :param str resource: Ghost resource to browse (`posts` or `pages`).
+        :param dict params: Query parameters shared by every page.
+        :param int page: Page number to fetch.
+
+        :returns: dict
+        """
+        resp = await self.request("GET", f"/{resource}/", params={**params, "page": page})
+        resp.raise_for_status()
+        return resp.json()
+
+    async def _apaginate(self, resource: str, params: dict, prefetch: int) -> AsyncIterator[dict]:
+        """
+        Yield resources from every page of a Ghost browse endpoint, prefetching upcoming pages as tasks.
+
+        :param str resource: Ghost resource to browse (`posts` or `pages`).
+        :param dict params: Query parameters shared by every page.
+        :param int prefetch: Number of pages fetched ahead of the consumer.
+
+        :returns: AsyncIterator[dict]
+        """
+        first_page = await self._afetch_page(resource, params, 1)
+        for item in first_page[resource]:
+            yield item
+        total_pages = first_page["meta"]["pagination"]["pages"]
+        pending = deque()
+        next_page = 2
+        try:
+            while next_page <= total_pages or pending:
+                while next_page <= total_pages and len(pending) < max(prefetch, 1):
+                    pending.append(asyncio.create_task(self._afetch_page(resource, params, next_page)))
+                    next_page += 1
+                results = await pending.popleft()
+                for item in results[resource]:
+                    yield item
+        finally:
+            for task in pending:
+                task.cancel()
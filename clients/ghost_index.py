@@ -0,0 +1,262 @@
+"""In-process index of Ghost posts & pages keyed by ID, slug and URL."""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set
+from urllib.parse import urlparse
+
+from clients.ghost import Ghost
+from log import LOGGER
+
+# Fields fetched for each indexed post or page.
+INDEX_FIELDS = "id,slug,title,url,status,updated_at"
+
+
+class GhostIndex:
+    """Bounded, expiring cache of Ghost posts & pages kept fresh by webhooks and delta syncs."""
+
+    def __init__(self, ghost: Ghost, ttl: float = 3600, max_size: int = 5000, sync_interval: float = 300):
+        """
+        :param Ghost ghost: Ghost admin client used to populate the index.
+        :param float ttl: Seconds an entry stays valid after it was last written.
+        :param int max_size: Maximum number of entries kept; least recently used entries are evicted first.
+        :param float sync_interval: Minimum seconds between delta syncs against Ghost.
+        """
+        self.ghost = ghost
+        self.ttl = ttl
+        self.max_size = max_size
+        self.sync_interval = sync_interval
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        self._slugs: Dict[str, str] = {}
+        self._paths: Dict[str, str] = {}
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()
+        self._refreshing = False
+        self._last_sync: Optional[float] = None
+        self._synced_through: Optional[str] = None
+        self._last_full_sync: Optional[float] = None
+        self.metrics = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0, "syncs": 0}
+
+    def upsert(self, item: dict, kind: str = "post") -> None:
+        """
+        Add or replace a post or page in the index; posts & pages which are no longer published are removed.
+
+        :param dict item: Ghost post or page containing at least `id` & `slug`.
+        :param str kind: Type of resource being indexed (`post` or `page`).
+        """
+        with self._lock:
+            self._discard(item["id"])
+            if item.get("status", "published") != "published":
+                return
+            entry = {field: item.get(field) for field in INDEX_FIELDS.split(",")}
+            entry.update({"kind": kind, "expires_at": time.monotonic() + self.ttl})
+            self._entries[item["id"]] = entry
+            self._slugs[item["slug"]] = item["id"]
+            if item.get("url"):
+                self._paths[self._path(item["url"])] = item["id"]
+            while len(self._entries) > self.max_size:
+                evicted_id = next(iter(self._entries))
+                self._discard(evicted_id)
+                self.metrics["evictions"] += 1
+
+    def remove(self, item_id: str) -> None:
+        """
+        Remove a post or page from the index.
+
+        :param str item_id: ID of Ghost post or page.
+        """
+        with self._lock:
+            self._discard(item_id)
+
+    def get_by_id(self, item_id: str) -> Optional[dict]:
+        """
+        Look up an indexed post or page by ID.
+
+        :param str item_id: ID of Ghost post or page.
+
+        :returns: Optional[dict]
+        """
+        self.refresh_if_stale()
+        with self._lock:
+            return self._lookup(item_id)
+
+    def get_by_slug(self, slug: str) -> Optional[dict]:
+        """
+        Look up an indexed post or page by slug.
+
+        :param str slug: Unique slug of Ghost post or page.
+
+        :returns: Optional[dict]
+        """
+        self.refresh_if_stale()
+        with self._lock:
+            return self._lookup(self._slugs.get(slug))
+
+    def get_by_url(self, url: str) -> Optional[dict]:
+        """
+        Look up an indexed post or page by absolute URL or path.
+
+        :param str url: URL (or path such as `/flask-routes/`) of Ghost post or page.
+
+        :returns: Optional[dict]
+        """
+        self.refresh_if_stale()
+        with self._lock:
+            return self._lookup(self._paths.get(self._path(url)))
+
+    def page_paths(self) -> Set[str]:
+        """
+        Paths of all indexed Ghost pages (ie: `/about/`).
+
+        :returns: Set[str]
+        """
+        self.refresh_if_stale()
+        with self._lock:
+            return {f"/{entry['slug']}/" for entry in self._entries.values() if entry["kind"] == "page"}
+
+    def refresh_if_stale(self) -> None:
+        """
+        Sync with Ghost if the previous sync is older than `sync_interval`.
+
+        The first sync runs inline so the index starts populated; later syncs run in a background thread
+        while lookups are served from the current entries.
+        """
+        if self._last_sync is None:
+            self.sync()
+            return
+        with self._lock:
+            if self._refreshing or time.monotonic() - self._last_sync < self.sync_interval:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._background_sync, name="ghost-index-sync", daemon=True).start()
+
+    def sync(self) -> int:
+        """
+        Sync posts & pages updated since the previous sync; everything is reloaded once per `ttl`.
+
+        Results are fetched without holding the index lock, so lookups & webhook upserts aren't blocked while
+        Ghost is paginated. A full reload replaces the index, dropping posts & pages which were deleted.
+
+        :returns: int
+        """
+        with self._sync_lock:
+            with self._lock:
+                full_sync = self._last_full_sync is None or time.monotonic() - self._last_full_sync >= self.ttl
+                filter_by = None if full_sync else f"updated_at:>='{self._synced_through}'"
+            started_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+            started = time.monotonic()
+            try:
+                post_filter = f"type:post+{filter_by}" if filter_by else "type:post"
+                posts = list(self.ghost.iter_posts(fields=INDEX_FIELDS, filter_by=post_filter))
+                pages = list(self.ghost.iter_pages(fields=INDEX_FIELDS, filter_by=filter_by))
+            except Exception as e:
+                LOGGER.error(f"Failed to sync Ghost index: {e}")
+                self._last_sync = time.monotonic()
+                return 0
+            if full_sync:
+                self._replace(posts, pages, started)
+            else:
+                with self._lock:
+                    for post in posts:
+                        self.upsert(post, kind="post")
+                    for page in pages:
+                        self.upsert(page, kind="page")
+            with self._lock:
+                self._synced_through = started_at
+                if full_sync:
+                    self._last_full_sync = time.monotonic()
+                self.metrics["syncs"] += 1
+                self._last_sync = time.monotonic()
+                indexed = len(self._entries)
+            LOGGER.info(f"Synced {len(posts) + len(pages)} Ghost posts & pages into index ({indexed} indexed).")
+            return len(posts) + len(pages)
+
+    def stats(self) -> dict:
+        """
+        Index size and hit/miss metrics.
+
+        :returns: dict
+        """
+        with self._lock:
+            lookups = self.metrics["hits"] + self.metrics["misses"]
+            return {
+                **self.metrics,
+                "size": len(self._entries),
+                "hit_rate": round(self.metrics["hits"] / lookups, 3) if lookups else None,
+            }
+
+    def _background_sync(self) -> None:
+        """Run a sync started by a lookup, allowing the next stale lookup to start another."""
+        try:
+            self.sync()
+        finally:
+            self._refreshing = False
+
+    def _replace(self, posts: List[dict], pages: List[dict], started: float) -> None:
+        """
+        Swap in an index built from a full listing of Ghost.
+
+        Entries written by webhooks after the listing started are carried over, as they may be newer than the listing.
+
+        :param List[dict] posts: Every Ghost post.
+        :param List[dict] pages: Every Ghost page.
+        :param float started: Monotonic time at which the listing started.
+        """
+        rebuilt = GhostIndex(self.ghost, ttl=self.ttl, max_size=self.max_size)
+        for post in posts:
+            rebuilt.upsert(post, kind="post")
+        for page in pages:
+            rebuilt.upsert(page, kind="page")
+        with self._lock:
+            written_since = [entry for entry in self._entries.values() if entry["expires_at"] - self.ttl >= started]
+            self._entries, self._slugs, self._paths = rebuilt._entries, rebuilt._slugs, rebuilt._paths
+            self.metrics["evictions"] += rebuilt.metrics["evictions"]
+            for entry in written_since:
+                self.upsert(entry, kind=entry["kind"])
+
+    def _lookup(self, item_id: Optional[str]) -> Optional[dict]:
+        """
+        Fetch a live entry by ID, recording hits & misses and dropping expired entries.
+
+        :param Optional[str] item_id: ID of Ghost post or page.
+
+        :returns: Optional[dict]
+        """
+        entry = self._entries.get(item_id) if item_id else None
+        if entry is not None and entry["expires_at"] < time.monotonic():
+            self._discard(item_id)
+            self.metrics["expired"] += 1
+            entry = None
+        if entry is None:
+            self.metrics["misses"] += 1
+            return None
+        self._entries.move_to_end(item_id)
+        self.metrics["hits"] += 1
+        return entry
+
+    def _discard(self, item_id: str) -> None:
+        """
+        Drop an entry along with its slug & URL keys.
+
+        :param str item_id: ID of Ghost post or page.
+        """
+        entry = self._entries.pop(item_id, None)
+        if entry is None:
+            return
+        if self._slugs.get(entry["slug"]) == item_id:
+            del self._slugs[entry["slug"]]
+        if entry.get("url") and self._paths.get(self._path(entry["url"])) == item_id:
+            del self._paths[self._path(entry["url"])]
+
+    @staticmethod
+    def _path(url: str) -> str:
+        """
+        Normalize a Ghost URL or path to its path with surrounding slashes.
+
+        :param str url: Absolute URL or path.
+
+        :returns: str
+        """
+        return f"/{urlparse(url).path.strip('/')}/"
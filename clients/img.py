@@ -1,15 +1,62 @@
 """Image transformer for remote images on GCS."""
 
-from io import BytesIO
-from typing import List, Optional
+import math
+import multiprocessing
+import os
+import queue
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import partial
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from google.cloud.exceptions import GoogleCloudError
 from google.cloud.storage.blob import Blob
-from PIL import Image
 
-from clients.gcs import GCS
+from clients.gcs import AUTH_ERRORS, BATCH_SIZE, GCS, refresh_on_auth_error
+from clients.inventory import BlobClassifier, ImageInventory
+from imaging import ImageVariant, resize_image
 from log import LOGGER
 
+# File extensions of formats variants may be converted to.
+FORMAT_EXTENSIONS = {"JPEG": ".jpg", "PNG": ".png", "WEBP": ".webp", "AVIF": ".avif"}
+FORMAT_CONTENT_TYPES = {"JPEG": "image/jpeg", "PNG": "image/png", "WEBP": "image/webp", "AVIF": "image/avif"}
+
+# Encoder quality for modern formats, by preset name.
+QUALITY_PRESETS = {
+    "low": {"WEBP": 60, "AVIF": 45},
+    "balanced": {"WEBP": 80, "AVIF": 60},
+    "high": {"WEBP": 90, "AVIF": 75},
+}
+
+# Assumed costs used to estimate the duration of a planned run.
+PLAN_REQUEST_SECONDS = 0.2
+PLAN_TRANSFER_BYTES_PER_SECOND = 25 * 1024 * 1024
+PLAN_RESIZE_SECONDS = 0.5
+
+# Variants generated from each standard-res image.
+DEFAULT_VARIANTS = (ImageVariant("mobile", "_mobile", scale=0.5),)
+
+
+def modern_format_variants(preset: str = "balanced", avif: bool = False) -> Tuple[ImageVariant, ...]:
+    """
+    Full-size WebP (and optionally AVIF) siblings of standard-res images, kept only when smaller than the source.
+
+    :param str preset: Key of `QUALITY_PRESETS` to encode with.
+    :param bool avif: Whether to generate AVIF siblings as well as WebP.
+
+    :returns: Tuple[ImageVariant, ...]
+    """
+    quality = QUALITY_PRESETS[preset]
+    formats = {"webp": "WEBP", "avif": "AVIF"} if avif else {"webp": "WEBP"}
+    return tuple(
+        ImageVariant(name, f"_{name}", format=fmt, quality=quality[fmt], suffix="", smaller_than_source=True)
+        for name, fmt in formats.items()
+    )
+
 
 class ImageTransformer(GCS):
     """Image generator for images stored on GCS."""
@@ -20,39 +67,187 @@ class ImageTransformer(GCS):
         gcp_api_credentials: str,
         bucket_name: str,
         bucket_url: str,
+        io_workers: int = 8,
+        cpu_workers: Optional[int] = None,
+        image_timeout: float = 120,
+        variants: Iterable[ImageVariant] = DEFAULT_VARIANTS,
+        cache_control: Optional[str] = "public, max-age=31536000",
     ):
+        """
+        :param int io_workers: Number of images whose GCS downloads/uploads run concurrently.
+        :param Optional[int] cpu_workers: Processes decoding & resizing images; defaults to the number of cores.
+        :param float image_timeout: Seconds allowed for each GCS request and each image resize.
+        :param Iterable[ImageVariant] variants: Resized variants to generate from each standard-res image.
+        :param Optional[str] cache_control: `Cache-Control` header set on generated variants.
+        """
         super().__init__(gcp_project_name, gcp_api_credentials, bucket_name, bucket_url)
+        self.io_workers = io_workers
+        self.cpu_workers = cpu_workers or os.cpu_count() or 1
+        self.image_timeout = image_timeout
+        self.variants = tuple(variants)
+        self.cache_control = cache_control
+        self.classifier = BlobClassifier(
+            self.variant_folders,
+            protected_folders=[variant.subfolder for variant in self.variants if variant.format],
+        )
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_pool_lock = threading.Lock()
+        self._scratch_dirs: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+
+    @property
+    def process_pool(self) -> ProcessPoolExecutor:
+        """
+        Process pool for CPU-bound image decoding & encoding, started on first use.
+
+        :returns: ProcessPoolExecutor
+        """
+        if self._process_pool is None:
+            with self._process_pool_lock:
+                if self._process_pool is None:
+                    # Spawned workers only import `imaging` (not `clients`, which instantiates every API client).
+                    self._process_pool = ProcessPoolExecutor(
+                        max_workers=self.cpu_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+        return self._process_pool
+
+    def close(self) -> None:
+        """Shut down the image processing pool and remove scratch files."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(cancel_futures=True)
+            self._process_pool = None
+        while not self._scratch_dirs.empty():
+            shutil.rmtree(self._scratch_dirs.get_nowait(), ignore_errors=True)
+
+    @contextmanager
+    def _scratch_files(self) -> Iterator[str]:
+        """
+        Borrow a local directory to stream an image & its variants through; directories are reused across images.
+
+        :returns: Iterator[str]
+        """
+        try:
+            scratch_dir = self._scratch_dirs.get_nowait()
+        except queue.Empty:
+            scratch_dir = tempfile.mkdtemp(prefix="img-")
+        try:
+            yield scratch_dir
+        finally:
+            self._scratch_dirs.put(scratch_dir)
+
+    @property
+    def variant_folders(self) -> Dict[str, str]:
+        """
+        Names of generated variants keyed by the subfolder they are stored in.
+
+        :returns: Dict[str, str]
+        """
+        return {"_retina": "retina", **{variant.subfolder: variant.name for variant in self.variants}}
+
+    def variant_blob_name(self, image_blob: Blob, variant: ImageVariant) -> str:
+        """
+        Path of a variant generated from a standard-res image.
+
+        :param Blob image_blob: Standard-res image blob.
+        :param ImageVariant variant: Variant to locate.
+
+        :returns: str
+        """
+        image_folder, image_name = self._get_folder_and_filename(image_blob)
+        stem, extension = os.path.splitext(image_name)
+        if variant.format:
+            extension = FORMAT_EXTENSIONS.get(variant.format, extension)
+        return f"{image_folder}/{variant.subfolder}/{stem}{variant.suffix}{extension}"
 
-    def get_standard_blobs(self, folder: str) -> List[Optional[Blob]]:
+    def variant_blob_names(self, image_blob: Blob) -> Dict[str, str]:
+        """
+        Paths of every variant generated from a standard-res image, keyed by variant name.
+
+        :param Blob image_blob: Standard-res image blob.
+
+        :returns: Dict[str, str]
+        """
+        return {
+            "retina": self._retina_blob_name(image_blob),
+            **{variant.name: self.variant_blob_name(image_blob, variant) for variant in self.variants},
+        }
+
+    def _run_batch(
+        self,
+        image_blobs: Iterable[Blob],
+        task: Callable[[Blob], Union[Optional[Blob], List[Blob]]],
+        label: str,
+    ) -> List[str]:
+        """
+        Apply `task` to each image concurrently, logging progress as images complete.
+
+        :param Iterable[Blob] image_blobs: Source images to process.
+        :param Callable[[Blob], Union[Optional[Blob], List[Blob]]] task: Per-image transformation returning new blobs.
+        :param str label: Name of the transformation for progress logs.
+
+        :returns: List[str]
+        """
+        image_blobs = list(image_blobs)
+        total = len(image_blobs)
+        created, failed = [], 0
+        started = time.monotonic()
+        progress_every = max(total // 10, 1)
+        with ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix=f"img-{label}") as executor:
+            futures = {executor.submit(task, image_blob): image_blob for image_blob in image_blobs}
+            for completed, future in enumerate(as_completed(futures), start=1):
+                try:
+                    new_blobs = future.result()
+                    if not isinstance(new_blobs, list):
+                        new_blobs = [new_blobs]
+                    created.extend(new_blob.name for new_blob in new_blobs if new_blob is not None)
+                except Exception as e:
+                    failed += 1
+                    LOGGER.error(f"Failed creating {label} image for `{futures[future].name}`: {e}")
+                if completed % progress_every == 0 or completed == total:
+                    elapsed = time.monotonic() - started
+                    LOGGER.info(
+                        f"{label.capitalize()} images: {completed}/{total} processed, {len(created)} created, "
+                        f"{failed} failed ({elapsed:.1f}s elapsed, {completed / max(elapsed, 1e-3):.1f} images/s)"
+                    )
+        return created
+
+    def inventory(self, folder: str) -> ImageInventory:
+        """
+        List a directory once and index its blobs for subsequent transformations.
+
+        :param str folder: GCS filepath from which to scan for images.
+
+        :returns: ImageInventory
+        """
+        inventory = ImageInventory(self.get(prefix=folder), self.classifier)
+        LOGGER.info(f"Listed {len(inventory)} blobs in `{folder}`.")
+        return inventory
+
+    def get_standard_blobs(self, folder: str, inventory: Optional[ImageInventory] = None) -> List[Optional[Blob]]:
         """
         Fetch all standard-res image blobs within a given directory.
 
         :param str folder: GCS filepath from which to scan for images.
+        :param Optional[ImageInventory] inventory: Existing listing of `folder` to use instead of listing it again.
 
         :returns: List[Optional[Blob]]
         """
-        files = self.get(prefix=folder)
-        files = list(files)
-        return [
-            file
-            for file in files
-            if "@2x" not in file.name
-            and "/_retina" not in file.name
-            and "/_mobile" not in file.name
-            and "/authors" not in file.name
-            and "/assets" not in file.name
-        ]
+        if inventory is None:
+            inventory = self.inventory(folder)
+        return inventory.by_category("standard")
 
-    def _get_retina_blobs(self, directory: str) -> List[Blob]:
+    def _get_retina_blobs(self, directory: str, inventory: Optional[ImageInventory] = None) -> List[Blob]:
         """
         Retrieve retina image blobs from directory in GCS bucket.
 
         :param str directory: Directory from which to fetch blobs.
+        :param Optional[ImageInventory] inventory: Existing listing of `directory` to use instead of listing it again.
 
         :returns: List[Blob]
         """
-        files = self.get(prefix=directory)
-        return [file for file in files if "@2x" in file.name and "/_retina" in file.name]
+        if inventory is None:
+            inventory = self.inventory(directory)
+        return [file for file in inventory.by_category("retina") if "@2x" in file.name]
 
     @LOGGER.catch
     def organize_retina_images(self, folder: str) -> List:
@@ -63,128 +258,302 @@ class ImageTransformer(GCS):
 
         :returns: List
         """
-        moved_blobs = []
-        image_blobs = self._get_retina_blobs(folder)
-        for image_blob in image_blobs:
+        moves = self._retina_moves(folder, self.inventory(folder))
+        moved_blobs, failed = self.move_blobs(moves)
+        LOGGER.info(f"Moved {len(moved_blobs)} of {len(moves)} retina images ({len(failed)} failed).")
+        return moved_blobs
+
+    def _retina_moves(self, folder: str, inventory: ImageInventory) -> List[Tuple[Blob, str]]:
+        """
+        Retina images to be moved into their respective folders, paired with their destinations.
+
+        :param str folder: Directory being organized.
+        :param ImageInventory inventory: Listing of `folder`.
+
+        :returns: List[Tuple[Blob, str]]
+        """
+        moves = []
+        for image_blob in self._get_retina_blobs(folder, inventory):
             image_folder, image_name = self._get_folder_and_filename(image_blob)
             if "/_retina/" in image_name:
                 continue
-            moved_blob = self.bucket.blob(f"{image_folder}/_retina/{image_name}")
-            if moved_blob.exists() is False:
-                moved_blob = self.bucket.copy_blob(image_blob, self.bucket, new_name=moved_blob.name)
-                image_blob.delete()
-                moved_blobs.append(moved_blob.name)
-                LOGGER.info(f"Moved `{image_blob.name}` -> `{moved_blob.name}`")
-            LOGGER.info(f"Ignored moving `{moved_blob.name}`")
-        return moved_blobs
+            moved_blob_name = f"{image_folder}/_retina/{image_name}"
+            if moved_blob_name in inventory:
+                LOGGER.info(f"Ignored moving `{moved_blob_name}`")
+                continue
+            moves.append((image_blob, moved_blob_name))
+        return moves
+
+    def plan_retina_organization(self, folder: str) -> dict:
+        """
+        Describe the moves `organize_retina_images` would make, without modifying the bucket.
+
+        :param str folder: Directory to organize images into subdirectories.
+
+        :returns: dict
+        """
+        inventory = self.inventory(folder)
+        moves = self._retina_moves(folder, inventory)
+        return {
+            "folder": folder,
+            "listed": len(inventory),
+            "moves": {
+                "count": len(moves),
+                "bytes": sum(image_blob.size or 0 for image_blob, _ in moves),
+                "blobs": [moved_blob_name for _, moved_blob_name in moves],
+            },
+            **self._estimate(len(inventory), batches=2 * math.ceil(len(moves) / BATCH_SIZE)),
+        }
+
+    def plan_transformations(
+        self,
+        folder: str,
+        inventory: Optional[ImageInventory] = None,
+        image_blobs: Optional[List[Blob]] = None,
+    ) -> dict:
+        """
+        Describe the purges, retina copies & variants a batch run would create, without modifying the bucket.
+
+        :param str folder: Directory to recursively apply image transformations.
+        :param Optional[ImageInventory] inventory: Existing listing of `folder`.
+        :param Optional[List[Blob]] image_blobs: Subset of standard-res images to plan for; defaults to all of them.
+
+        :returns: dict
+        """
+        if inventory is None:
+            inventory = self.inventory(folder)
+        if image_blobs is None:
+            image_blobs = self.get_standard_blobs(folder, inventory)
+        purges = self._unwanted_blobs(inventory)
+        retina_copies = [
+            (image_blob, self._retina_blob_name(image_blob))
+            for image_blob in image_blobs
+            if not self._blob_exists(self._retina_blob_name(image_blob), inventory)
+        ]
+        uploads, download_bytes, upload_bytes, downloads = [], 0, 0, 0
+        for image_blob in image_blobs:
+            missing_variants = [
+                variant
+                for variant in self.variants
+                if not self._blob_exists(self.variant_blob_name(image_blob, variant), inventory)
+            ]
+            if missing_variants:
+                downloads += 1
+                download_bytes += image_blob.size or 0
+            for variant in missing_variants:
+                uploads.append(self.variant_blob_name(image_blob, variant))
+                upload_bytes += int((image_blob.size or 0) * (variant.scale or 1) ** 2)
+        return {
+            "folder": folder,
+            "listed": len(inventory),
+            "purge": {
+                "count": len(purges),
+                "bytes": sum(blob.size or 0 for blob in purges),
+                "blobs": [blob.name for blob in purges],
+            },
+            "retina": {
+                "count": len(retina_copies),
+                "bytes": sum(image_blob.size or 0 for image_blob, _ in retina_copies),
+                "blobs": [retina_blob_name for _, retina_blob_name in retina_copies],
+            },
+            "variants": {
+                "count": len(uploads),
+                "downloads": downloads,
+                "download_bytes": download_bytes,
+                "estimated_upload_bytes": upload_bytes,
+                "blobs": uploads,
+            },
+            **self._estimate(
+                len(inventory),
+                requests=len(retina_copies) + downloads + len(uploads),
+                batches=math.ceil(len(purges) / BATCH_SIZE),
+                transfer_bytes=download_bytes + upload_bytes,
+                resizes=downloads,
+            ),
+        }
+
+    def _estimate(
+        self,
+        listed: int,
+        requests: int = 0,
+        batches: int = 0,
+        transfer_bytes: int = 0,
+        resizes: int = 0,
+    ) -> dict:
+        """
+        Estimate the API calls & wall-clock time of a planned run from the configured worker pools.
+
+        Upload sizes of resized variants are approximated from their area, so byte totals are estimates.
+
+        :param int listed: Number of blobs listed.
+        :param int requests: Individual GCS requests (downloads, uploads & copies) spread across I/O workers.
+        :param int batches: Batch requests of up to `BATCH_SIZE` deletes or copies each.
+        :param int transfer_bytes: Bytes downloaded & uploaded.
+        :param int resizes: Images decoded & resized across CPU workers.
+
+        :returns: dict
+        """
+        api_calls = {
+            "list": max(math.ceil(listed / 1000), 1),
+            "batch": batches,
+            "individual": requests,
+        }
+        estimated_seconds = (
+            (api_calls["list"] + api_calls["batch"]) * PLAN_REQUEST_SECONDS
+            + requests * PLAN_REQUEST_SECONDS / self.io_workers
+            + transfer_bytes / PLAN_TRANSFER_BYTES_PER_SECOND
+            + resizes * PLAN_RESIZE_SECONDS / self.cpu_workers
+        )
+        return {
+            "api_calls": {**api_calls, "total": sum(api_calls.values())},
+            "estimated_seconds": round(estimated_seconds, 1),
+        }
 
     @LOGGER.catch
-    def purge_unwanted_images(self, folder: str) -> List[str]:
+    def purge_unwanted_images(self, folder: str, inventory: Optional[ImageInventory] = None) -> List[str]:
         """
-        Delete images which have been compressed or generated multiple times.
+        Delete images which have been compressed, generated or uploaded multiple times.
 
         :param str folder: Directory to recursively apply image transformations.
+        :param Optional[ImageInventory] inventory: Existing listing of `folder`; purged blobs are removed from it.
 
         :returns: List[str]
         """
-        images_purged = []
         LOGGER.info("Purging unwanted images...")
-        substrings = [
-            "@2x@2x",
-            "_o",
-            "psd",
-            "?",
-            "@2x-",
-            "-1-1",
-            "-1-2",
-            ".webp",
-            "_retina/_retina",
-            "_retina/_mobile/",
-        ]
-        blobs = self.get(
-            folder,
-        )
-        image_blob_names = [blob.name for blob in blobs]
-        for image_blob_name in image_blob_names:
-            if any(substr in image_blob_name for substr in substrings):
-                self.bucket.delete_blob(image_blob_name)
-                images_purged.append(image_blob_name)
-                LOGGER.info(f"Deleted {image_blob_name}.")
+        if inventory is None:
+            inventory = self.inventory(folder)
+        unwanted_blob_names = [blob.name for blob in self._unwanted_blobs(inventory)]
+        images_purged, _ = self.delete_blobs(unwanted_blob_names)
+        for image_blob_name in images_purged:
+            inventory.discard(image_blob_name)
+            LOGGER.info(f"Deleted {image_blob_name}.")
         return images_purged
 
+    @staticmethod
+    def _unwanted_blobs(inventory: ImageInventory) -> List[Blob]:
+        """
+        Images to delete: purge candidates & retina images uploaded more than once.
+
+        :param ImageInventory inventory: Listing of the folder being purged.
+
+        :returns: List[Blob]
+        """
+        return inventory.by_category("purge") + inventory.by_category("repeat")
+
     @LOGGER.catch
-    def retina_transformations(self, folder: str) -> List[Optional[str]]:
+    def retina_transformations(
+        self,
+        folder: str,
+        inventory: Optional[ImageInventory] = None,
+        image_blobs: Optional[List[Blob]] = None,
+    ) -> List[Optional[str]]:
         """
         Create retina image variants of standard-res images.
 
         :param str folder: Directory to recursively apply image transformations.
+        :param Optional[ImageInventory] inventory: Existing listing of `folder`, replacing per-image existence checks.
+        :param Optional[List[Blob]] image_blobs: Subset of standard-res images to process; defaults to all of them.
 
         :returns: List[Optional[str]]
         """
-        images_transformed = []
-        image_blobs = self.get_standard_blobs(folder)
+        if inventory is None:
+            inventory = self.inventory(folder)
+        if image_blobs is None:
+            image_blobs = self.get_standard_blobs(folder, inventory)
         LOGGER.info(f"Creating retina variants for {len(image_blobs)} images...")
-        for image_blob in image_blobs:
-            retina_image_blob = self.create_retina_image(image_blob)
-            if retina_image_blob is not None:
-                images_transformed.append(retina_image_blob.name)
-        return images_transformed
+        return self._run_batch(image_blobs, partial(self.create_retina_image, inventory=inventory), "retina")
 
-    def create_retina_image(self, image_blob: Blob) -> Optional[Blob]:
+    @refresh_on_auth_error
+    def create_retina_image(self, image_blob: Blob, inventory: Optional[ImageInventory] = None) -> Optional[Blob]:
         """
         Create a single retina image variant of a standard-res image.
 
         :param Blob image_blob: Image blob object.
+        :param Optional[ImageInventory] inventory: Listing of the image's folder; checks GCS directly if omitted.
 
         :returns: Optional[Blob]
         """
-        image_folder, image_name = self._get_folder_and_filename(image_blob)
-        retina_blob_filepath = (
-            f"{image_folder}/_retina/{image_name.replace('.jpg', '@2x.jpg').replace('.png', '@2x.png')}"
-        )
-        retina_image_blob = self.bucket.blob(retina_blob_filepath)
-        if retina_image_blob.exists() is False:
-            self.bucket.copy_blob(image_blob, self.bucket, new_name=retina_blob_filepath)
-            new_retina_image_blob = self.bucket.blob(retina_blob_filepath)
+        retina_blob_filepath = self._retina_blob_name(image_blob)
+        if not self._blob_exists(retina_blob_filepath, inventory):
+            new_retina_image_blob = self.bucket.copy_blob(
+                image_blob, self.bucket, new_name=retina_blob_filepath, timeout=self.image_timeout
+            )
+            if inventory is not None:
+                inventory.add(new_retina_image_blob)
             LOGGER.success(f"Created retina image `{retina_blob_filepath}`")
             return new_retina_image_blob
         LOGGER.info(f"Skipping retina image `{retina_blob_filepath}`; already exists.")
 
+    def _retina_blob_name(self, image_blob: Blob) -> str:
+        """
+        Path of the retina copy of a standard-res image.
+
+        :param Blob image_blob: Standard-res image blob.
+
+        :returns: str
+        """
+        image_folder, image_name = self._get_folder_and_filename(image_blob)
+        return f"{image_folder}/_retina/{image_name.replace('.jpg', '@2x.jpg').replace('.png', '@2x.png')}"
+
     @LOGGER.catch
-    def mobile_transformations(self, folder: str) -> List[Optional[str]]:
+    def variant_transformations(
+        self,
+        folder: str,
+        inventory: Optional[ImageInventory] = None,
+        image_blobs: Optional[List[Blob]] = None,
+    ) -> List[Optional[str]]:
         """
-        Create mobile image variants of standard-res images.
+        Create resized image variants (ie: mobile) of standard-res images.
 
         :param str folder: Directory to recursively apply image transformations.
+        :param Optional[ImageInventory] inventory: Existing listing of `folder`, replacing per-image existence checks.
+        :param Optional[List[Blob]] image_blobs: Subset of standard-res images to process; defaults to all of them.
 
         :returns: List[Optional[str]]
         """
-        images_transformed = []
-        image_blobs = self.get_standard_blobs(folder)
-        LOGGER.info(f"Creating mobile variants for {len(image_blobs)} images...")
-        for image_blob in image_blobs:
-            mobile_image_blob = self.create_mobile_image(image_blob)
-            if mobile_image_blob is not None:
-                images_transformed.append(mobile_image_blob.name)
-        return images_transformed
+        if inventory is None:
+            inventory = self.inventory(folder)
+        if image_blobs is None:
+            image_blobs = self.get_standard_blobs(folder, inventory)
+        LOGGER.info(f"Creating {len(self.variants)} variants for {len(image_blobs)} images...")
+        return self._run_batch(image_blobs, partial(self.create_image_variants, inventory=inventory), "variant")
+
+    @refresh_on_auth_error
+    def create_image_variants(self, image_blob: Blob, inventory: Optional[ImageInventory] = None) -> List[Blob]:
+        """
+        Create every missing resized variant of a standard-res image.
+
+        :param Blob image_blob: Standard resolution image blob from which to create variants.
+        :param Optional[ImageInventory] inventory: Listing of the image's folder; checks GCS directly if omitted.
 
-    def create_mobile_image(self, image_blob: Blob) -> Optional[Blob]:
+        :returns: List[Blob]
+        """
+        missing_variants = [
+            variant
+            for variant in self.variants
+            if not self._blob_exists(self.variant_blob_name(image_blob, variant), inventory)
+        ]
+        if not missing_variants:
+            LOGGER.info(f"Skipping variants of `{image_blob.name}`; already exist.")
+            return []
+        new_blobs = self._transform_image(image_blob, missing_variants, inventory)
+        if inventory is not None:
+            for new_blob in new_blobs:
+                inventory.add(new_blob)
+        return new_blobs
+
+    def _blob_exists(self, blob_name: str, inventory: Optional[ImageInventory] = None) -> bool:
         """
-        Create single mobile image variant for a given image blob.
+        Check whether a blob exists, using an inventory when available instead of a request to GCS.
 
-        :param Blob image_blob: Standard resolution image blob from which to create retina image.
+        :param str blob_name: Full path of blob within bucket.
+        :param Optional[ImageInventory] inventory: Listing of the folder containing `blob_name`.
 
-        :returns: Optional[Blob]
+        :returns: bool
         """
-        image_folder, image_name = self._get_folder_and_filename(image_blob)
-        mobile_blob_filepath = (
-            f"{image_folder}/_mobile/{image_name.replace('.jpg', '@2x.jpg').replace('.png', '@2x.png')}"
-        )
-        mobile_image_blob = self.bucket.blob(mobile_blob_filepath)
-        if mobile_image_blob.exists() is False:
-            new_mobile_image_blob = self._transform_mobile_image(image_blob, mobile_image_blob)
-            return new_mobile_image_blob
-        LOGGER.info(f"Skipping mobile image `{mobile_blob_filepath}`; already exists.")
+        if inventory is not None:
+            return blob_name in inventory or inventory.is_skipped(blob_name)
+        return self.bucket.blob(blob_name).exists(timeout=self.image_timeout)
 
     @staticmethod
     def _set_image_metadata(blob: Blob) -> Optional[dict]:
@@ -195,36 +564,75 @@ class ImageTransformer(GCS):
 
         :returns: Optional[dict]
         """
-        if ".jpg" in blob.name and "octet-stream" in blob.content_type:
-            return {"format": "JPG", "content-type": "image/jpg"}
-        if ".png" in blob.name:
-            return {"format": "PNG", "content-type": "image/png"}
-        if ".webp" in blob.name:
-            return {"format": "WEBP", "content-type": "image/webp"}
-        return None
+        extension = os.path.splitext(blob.name)[1].lower()
+        image_format = {".jpeg": "JPEG", **{ext: fmt for fmt, ext in FORMAT_EXTENSIONS.items()}}.get(extension)
+        if image_format is None:
+            return None
+        return {"format": image_format, "content-type": FORMAT_CONTENT_TYPES[image_format]}
 
-    def _transform_mobile_image(self, original_image_blob: Blob, new_image_blob: Blob) -> Optional[Blob]:
+    def _transform_image(
+        self,
+        original_image_blob: Blob,
+        variants: List[ImageVariant],
+        inventory: Optional[ImageInventory] = None,
+    ) -> List[Blob]:
         """
-        Create smaller image size to be served on mobile devices.
+        Render resized variants of an image from a single download & decode, then upload them.
 
         :param Blob original_image_blob: Original image blob.
-        :param Blob new_image_blob: New newly created Blob for mobile image.
+        :param List[ImageVariant] variants: Variants to generate.
+        :param Optional[ImageInventory] inventory: Listing of the image's folder, noting variants discarded as larger.
 
-        :returns: Optional[Blob]
+        :returns: List[Blob]
         """
         img_meta = self._set_image_metadata(original_image_blob)
-        img_bytes = original_image_blob.download_as_bytes()
-        if img_bytes:
-            stream = BytesIO(img_bytes)
-            im = Image.open(stream)
+        if img_meta is None:
+            LOGGER.info(f"Skipping variants of `{original_image_blob.name}`; unsupported image format.")
+            return []
+        new_blobs = []
+        with self._scratch_files() as scratch_dir:
             try:
-                with BytesIO() as output:
-                    new_image = im.reduce(2)
-                    new_image.save(output, format=img_meta["format"])
-                    new_image_blob.upload_from_string(output.getvalue(), content_type=img_meta["content-type"])
-                    LOGGER.success(f"Created mobile image `{new_image_blob.name}`")
-                    return new_image_blob
+                source_path = os.path.join(scratch_dir, "source")
+                original_image_blob.download_to_filename(source_path, client=self.client, timeout=self.image_timeout)
+                if os.path.getsize(source_path) == 0:
+                    return []
+                outputs = [
+                    (
+                        os.path.join(scratch_dir, variant.name),
+                        variant._replace(format=variant.format or img_meta["format"]),
+                    )
+                    for variant in variants
+                ]
+                resized = self.process_pool.submit(resize_image, source_path, outputs)
+                peak_rss_kb, failures = resized.result(timeout=self.image_timeout)
+                source_size = os.path.getsize(source_path)
+                for output_path, variant in outputs:
+                    new_image_blob = self.bucket.blob(self.variant_blob_name(original_image_blob, variant))
+                    if variant.name in failures:
+                        LOGGER.error(
+                            f"Failed to render {variant.name} image `{new_image_blob.name}`: {failures[variant.name]}"
+                        )
+                        continue
+                    if variant.smaller_than_source and os.path.getsize(output_path) >= source_size:
+                        LOGGER.info(f"Discarded {variant.name} image `{new_image_blob.name}`; larger than source.")
+                        if inventory is not None:
+                            inventory.skip(new_image_blob.name)
+                        continue
+                    new_image_blob.cache_control = self.cache_control
+                    new_image_blob.upload_from_filename(
+                        output_path,
+                        content_type=FORMAT_CONTENT_TYPES.get(variant.format, img_meta["content-type"]),
+                        timeout=self.image_timeout,
+                    )
+                    new_blobs.append(new_image_blob)
+                    LOGGER.success(
+                        f"Created {variant.name} image `{new_image_blob.name}` "
+                        f"(peak RSS {peak_rss_kb / 1024:.0f} MB)"
+                    )
+            except AUTH_ERRORS:
+                raise
             except GoogleCloudError as e:
-                LOGGER.error(f"GoogleCloudError while saving mobile image `{new_image_blob.name}`: {e}")
+                LOGGER.error(f"GoogleCloudError while saving variants of `{original_image_blob.name}`: {e}")
             except Exception as e:
-                LOGGER.error(f"Unexpected exception while saving mobile image `{new_image_blob.name}`: {e}")
+                LOGGER.error(f"Unexpected exception while saving variants of `{original_image_blob.name}`: {e}")
+        return new_blobs
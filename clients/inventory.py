@@ -0,0 +1,199 @@
+"""In-memory inventory of image blobs from a single GCS listing."""
+
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from google.cloud.storage.blob import Blob
+
+# Names of generated image variants, keyed by the subfolder holding them.
+VARIANT_FOLDERS = {"_retina": "retina", "_mobile": "mobile"}
+
+# Substrings of images which have been compressed or generated multiple times.
+PURGE_SUBSTRINGS = (
+    "@2x@2x",
+    "_o",
+    "psd",
+    "?",
+    "@2x-",
+    "-1-1",
+    "-1-2",
+    ".webp",
+    "_retina/_retina",
+    "_retina/_mobile/",
+)
+
+# Filenames of retina images uploaded more than once (ie: `image-1-2@2x.jpg`).
+REPEAT_PATTERN = re.compile(r"-[0-9]-[0-9]@2x\.jpg")
+
+
+class BlobClassifier:
+    """Assigns each blob name a single category, so a listing is scanned once rather than once per stage."""
+
+    def __init__(self, variant_folders: Optional[Dict[str, str]] = None, protected_folders: Iterable[str] = ()):
+        """
+        :param Optional[Dict[str, str]] variant_folders: Variant names keyed by subfolder; defaults to retina & mobile.
+        :param Iterable[str] protected_folders: Variant subfolders whose contents are never purge candidates.
+        """
+        self.variant_folders = variant_folders or VARIANT_FOLDERS
+        self.protected_folders = frozenset(protected_folders)
+
+    def category(self, blob_name: str) -> str:
+        """
+        Categorize a blob as `purge`, `repeat`, `ignored`, `standard`, or the name of the variant it is.
+
+        :param str blob_name: Full path of blob within bucket.
+
+        :returns: str
+        """
+        folder, _, filename = blob_name.rpartition("/")
+        subfolder = folder[folder.rfind("/") + 1 :]
+        if subfolder in self.protected_folders:
+            return self.variant_folders[subfolder]
+        for substring in PURGE_SUBSTRINGS:
+            if substring in blob_name:
+                return "purge"
+        if "@2x.jpg" in filename and REPEAT_PATTERN.search(filename):
+            return "repeat"
+        if subfolder in self.variant_folders:
+            return self.variant_folders[subfolder]
+        if "@2x" in filename or "/authors" in blob_name or "/assets" in blob_name:
+            return "ignored"
+        return "standard"
+
+
+class ImageInventory:
+    """Blobs beneath a prefix, indexed by folder, image name & variant."""
+
+    def __init__(self, blobs: Iterable[Blob], classifier: Optional[BlobClassifier] = None):
+        """
+        :param Iterable[Blob] blobs: Result of listing a prefix in the GCS bucket.
+        :param Optional[BlobClassifier] classifier: Categorizes blobs; defaults to retina & mobile variants.
+        """
+        self.classifier = classifier or BlobClassifier()
+        self._blobs: Dict[str, Blob] = {}
+        self._categories: Dict[str, Dict[str, Blob]] = defaultdict(dict)
+        self._images: Dict[Tuple[str, str], Dict[str, Blob]] = defaultdict(dict)
+        self._skipped: Set[str] = set()
+        self._lock = threading.Lock()
+        for blob in blobs:
+            self.add(blob)
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    def __contains__(self, blob_name: str) -> bool:
+        return blob_name in self._blobs
+
+    def classify(self, blob_name: str) -> Tuple[str, str, str]:
+        """
+        Split a blob name into the folder of its original image, the original image's filename & its variant.
+
+        ie: `2021/04/_retina/image@2x.jpg` -> (`2021/04`, `image.jpg`, `retina`)
+
+        :param str blob_name: Full path of blob within bucket.
+
+        :returns: Tuple[str, str, str]
+        """
+        folder, _, filename = blob_name.rpartition("/")
+        parent, _, subfolder = folder.rpartition("/")
+        if subfolder in self.classifier.variant_folders:
+            return parent, filename.replace("@2x", ""), self.classifier.variant_folders[subfolder]
+        if "@2x" in filename:
+            return folder, filename.replace("@2x", ""), "@2x"
+        return folder, filename, "standard"
+
+    @property
+    def blobs(self) -> List[Blob]:
+        """
+        All blobs currently in the inventory.
+
+        :returns: List[Blob]
+        """
+        with self._lock:
+            return list(self._blobs.values())
+
+    def by_category(self, category: str) -> List[Blob]:
+        """
+        Blobs assigned a given category by the classifier (ie: `standard`, `retina` or `purge`).
+
+        :param str category: Category assigned by `BlobClassifier.category`.
+
+        :returns: List[Blob]
+        """
+        with self._lock:
+            return list(self._categories.get(category, {}).values())
+
+    def variants(self, folder: str, filename: str) -> Dict[str, Blob]:
+        """
+        Every known variant of an original image, keyed by variant.
+
+        :param str folder: Folder of the original image.
+        :param str filename: Filename of the original image.
+
+        :returns: Dict[str, Blob]
+        """
+        with self._lock:
+            return dict(self._images.get((folder, filename), {}))
+
+    def get(self, blob_name: str) -> Optional[Blob]:
+        """
+        Fetch a blob by name without contacting GCS.
+
+        :param str blob_name: Full path of blob within bucket.
+
+        :returns: Optional[Blob]
+        """
+        with self._lock:
+            return self._blobs.get(blob_name)
+
+    def add(self, blob: Blob) -> None:
+        """
+        Record a blob which has been listed or created.
+
+        :param Blob blob: Blob within the inventoried prefix.
+        """
+        folder, filename, variant = self.classify(blob.name)
+        category = self.classifier.category(blob.name)
+        with self._lock:
+            self._blobs[blob.name] = blob
+            self._images[(folder, filename)][variant] = blob
+            self._categories[category][blob.name] = blob
+
+    def discard(self, blob_name: str) -> None:
+        """
+        Forget a blob which has been deleted.
+
+        :param str blob_name: Full path of blob within bucket.
+        """
+        folder, filename, variant = self.classify(blob_name)
+        category = self.classifier.category(blob_name)
+        with self._lock:
+            self._blobs.pop(blob_name, None)
+            self._categories[category].pop(blob_name, None)
+            image = self._images.get((folder, filename))
+            if image is not None and image.get(variant) is not None and image[variant].name == blob_name:
+                del image[variant]
+                if not image:
+                    del self._images[(folder, filename)]
+
+    def skip(self, blob_name: str) -> None:
+        """
+        Note a variant which was deliberately not created (ie: it would have been larger than its source).
+
+        :param str blob_name: Full path the variant would have been stored at.
+        """
+        with self._lock:
+            self._skipped.add(blob_name)
+
+    def is_skipped(self, blob_name: str) -> bool:
+        """
+        Whether a variant was deliberately not created.
+
+        :param str blob_name: Full path the variant would have been stored at.
+
+        :returns: bool
+        """
+        with self._lock:
+            return blob_name in self._skipped
@@ -0,0 +1,40 @@
+"""Rate limiting for outbound API requests."""
+
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """
+    Token-bucket style rate limiter for coroutines.
+
+    Uses the generic cell rate algorithm: each request reserves the next free slot synchronously
+    and then sleeps until it arrives, so no lock (and no binding to a particular event loop) is needed.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        :param float rate: Sustained number of requests allowed per second.
+        :param int burst: Number of requests allowed back-to-back before throttling applies.
+        """
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._theoretical_arrival = 0.0
+
+    async def acquire(self) -> float:
+        """
+        Wait until a request may be sent.
+
+        :returns: float
+        """
+        if self.interval == 0:
+            return 0.0
+        now = time.monotonic()
+        arrival = max(self._theoretical_arrival, now)
+        delay = arrival - now - (self.burst - 1) * self.interval
+        self._theoretical_arrival = arrival + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+            return delay
+        return 0.0
@@ -3,7 +3,7 @@
 import pytest
 from google.cloud.bigquery import Client as gbqClient
 
-from clients.ghost import Ghost
+from clients.ghost import AsyncGhost, Ghost
 from clients.mail import Mailgun
 from config import settings
 
@@ -20,6 +20,18 @@ def ghost() -> Ghost:
     )
 
 
+@pytest.fixture
+def ghost_async() -> AsyncGhost:
+    return AsyncGhost(
+        admin_api_url=settings.GHOST_ADMIN_API_URL,
+        api_version=settings.GHOST_API_VERSION,
+        content_api_url=settings.GHOST_CONTENT_API_URL,
+        client_id=settings.GHOST_CLIENT_ID,
+        client_secret=settings.GHOST_ADMIN_API_KEY,
+        content_api_key=settings.GHOST_CONTENT_API_KEY,
+    )
+
+
 @pytest.fixture
 def mailgun() -> Mailgun:
     return Mailgun(
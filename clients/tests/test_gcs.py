@@ -0,0 +1,100 @@
+"""Test Google Cloud Storage helpers."""
+
+from google.api_core.exceptions import Unauthorized
+from google.auth.exceptions import RefreshError
+from google.cloud import storage
+
+from clients.gcs import GCS, url_to_blob_path
+from clients.img import ImageTransformer
+from clients.inventory import ImageInventory
+
+
+def test_url_to_blob_path():
+    """CDN & GCS URLs of objects within the bucket resolve to blob paths; other URLs don't."""
+    bucket_name, bucket_url = "hackers", "https://cdn.hackersandslackers.com"
+    assert url_to_blob_path("https://cdn.hackersandslackers.com/2017/11/welcome.jpg", bucket_name, bucket_url) == (
+        "2017/11/welcome.jpg"
+    )
+    assert url_to_blob_path("https://storage.googleapis.com/hackers/2017/11/welcome.jpg", bucket_name, bucket_url) == (
+        "2017/11/welcome.jpg"
+    )
+    assert url_to_blob_path("https://hackers.storage.googleapis.com/2017/11/a%20b.jpg", bucket_name, bucket_url) == (
+        "2017/11/a b.jpg"
+    )
+    assert url_to_blob_path("gs://hackers/2017/11/welcome.jpg", bucket_name, bucket_url) == "2017/11/welcome.jpg"
+    assert url_to_blob_path("https://storage.googleapis.com/other/welcome.jpg", bucket_name, bucket_url) is None
+    assert url_to_blob_path("https://example.com/2017/11/welcome.jpg", bucket_name, bucket_url) is None
+
+
+class FakeResponse:
+    status_code = 204
+
+
+class FakeBatch:
+    def __init__(self, client: "FakeClient"):
+        self.client = client
+        self._responses = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self.client.expired:
+            raise RefreshError("token expired")
+        self._responses = [FakeResponse() for _ in self.client.bucket.deleted]
+
+
+class FakeBucket:
+    def __init__(self):
+        self.deleted = []
+
+    def delete_blob(self, blob_name: str):
+        self.deleted.append(blob_name)
+
+
+class FakeClient:
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.expired = not FakeClient.instances
+        self.bucket = FakeBucket()
+        FakeClient.instances.append(self)
+
+    def get_bucket(self, name: str) -> FakeBucket:
+        return self.bucket
+
+    def batch(self, raise_exception: bool = True) -> FakeBatch:
+        return FakeBatch(self)
+
+
+def test_batch_rebuilds_client_on_auth_error(monkeypatch):
+    """A batch rejected for expired credentials is resent once with a new client & bucket."""
+    monkeypatch.setattr(FakeClient, "instances", [])
+    monkeypatch.setattr(storage, "Client", FakeClient)
+    gcs = GCS("project", None, "hackers", "https://cdn.hackersandslackers.com")
+    deleted, failed = gcs.delete_blobs(["2021/04/image_o.jpg", "2021/04/image@2x@2x.jpg"])
+    assert len(FakeClient.instances) == 2
+    assert FakeClient.instances[1].bucket.deleted == ["2021/04/image_o.jpg", "2021/04/image@2x@2x.jpg"]
+    assert deleted == ["2021/04/image_o.jpg", "2021/04/image@2x@2x.jpg"]
+    assert failed == {}
+
+
+def test_transform_image_refreshes_on_auth_error(monkeypatch):
+    """Auth errors escape `_transform_image`, so `create_image_variants` rebuilds the client & retries."""
+    monkeypatch.setattr(FakeClient, "instances", [])
+    monkeypatch.setattr(storage, "Client", FakeClient)
+    transformer = ImageTransformer("project", None, "hackers", "https://cdn.hackersandslackers.com")
+    clients = []
+
+    class FakeBlob:
+        name = "2021/04/image.jpg"
+
+        def download_to_filename(self, filename: str, client=None, timeout=None):
+            clients.append(client)
+            if len(clients) == 1:
+                raise Unauthorized("token revoked")
+            open(filename, "wb").close()
+
+    assert transformer.create_image_variants(FakeBlob(), ImageInventory([])) == []
+    assert clients == FakeClient.instances
+    assert len(clients) == 2
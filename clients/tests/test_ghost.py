@@ -1,3 +1,7 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+
 def test_get_ghost_post(ghost):
     post = ghost.get_post("61304d8374047afda1c2168b")
     assert post is not None
@@ -9,3 +13,38 @@ def test_get_ghost_authors(ghost):
     for author in authors:
         assert author["id"] is not None
         assert len(authors) > 1
+
+
+def test_get_ghost_post_async(ghost_async):
+    post = asyncio.run(ghost_async.get_post("61304d8374047afda1c2168b"))
+    assert post is not None
+    assert post["id"] == "61304d8374047afda1c2168b"
+
+
+def test_session_token_cached(ghost):
+    token = ghost.session_token
+    assert ghost.session_token == token
+    assert ghost.token_stats["signed"] == 1
+    assert ghost.token_stats["reused"] == 1
+
+
+def test_session_token_shared_across_threads(ghost):
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        tokens = list(executor.map(lambda _: ghost.session_token, range(2000)))
+    assert len(set(tokens)) == 1
+    assert ghost.token_stats == {"signed": 1, "reused": 1999}
+
+
+def test_iter_posts_walks_all_pages(ghost):
+    posts = list(ghost.iter_posts(limit=15, fields="id,slug"))
+    assert len(posts) > 15
+    assert len({post["id"] for post in posts}) == len(posts)
+
+
+def test_async_session_closed_on_new_event_loop(ghost_async):
+    first = asyncio.run(ghost_async.async_session())
+    second = asyncio.run(ghost_async.async_session())
+    assert first.is_closed
+    assert second is not first
+    asyncio.run(ghost_async.aclose())
+    assert second.is_closed
@@ -0,0 +1,70 @@
+"""Test cached index of Ghost posts & pages."""
+
+import threading
+import time
+from typing import Iterator
+
+from clients.ghost import Ghost
+from clients.ghost_index import GhostIndex
+
+
+def test_ghost_index_lookups(ghost: Ghost):
+    """
+    Index is populated on first lookup and serves subsequent lookups from memory.
+
+    :param Ghost ghost: Ghost admin client.
+    """
+    index = GhostIndex(ghost, ttl=60, max_size=5000, sync_interval=60)
+    post = index.get_by_slug("flask-routes")
+    assert post is not None
+    assert post["title"] == "The Art of Routing in Flask"
+    assert index.get_by_id(post["id"])["slug"] == "flask-routes"
+    assert index.get_by_url(post["url"])["id"] == post["id"]
+    assert index.stats()["syncs"] == 1
+    assert index.stats()["hits"] == 3
+
+
+class FakeGhost:
+    """Ghost client serving a fixed listing, which blocks until released when `gate` is set."""
+
+    def __init__(self, posts: list):
+        self.posts = posts
+        self.gate = None
+
+    def iter_posts(self, fields: str, filter_by: str) -> Iterator[dict]:
+        if self.gate is not None:
+            self.gate.wait(5)
+        yield from self.posts
+
+    def iter_pages(self, fields: str, filter_by: str) -> Iterator[dict]:
+        yield from ()
+
+
+def test_ghost_index_sync_evictions():
+    """Unpublished posts are removed, full syncs drop deleted posts, and lookups don't wait on a running sync."""
+    ghost = FakeGhost(
+        [
+            {"id": "1", "slug": "flask-routes", "url": "/flask-routes/", "status": "published"},
+            {"id": "2", "slug": "old-post", "url": "/old-post/", "status": "published"},
+            {"id": "3", "slug": "draft-post", "url": "/draft-post/", "status": "draft"},
+        ]
+    )
+    index = GhostIndex(ghost, ttl=60, sync_interval=60)
+    assert index.get_by_slug("old-post") is not None
+    assert index.get_by_slug("draft-post") is None
+    index.upsert({"id": "1", "slug": "flask-routes", "url": "/flask-routes/", "status": "draft"})
+    assert index.get_by_id("1") is None
+
+    ghost.posts = ghost.posts[:1]
+    ghost.gate = threading.Event()
+    index._last_sync, index._last_full_sync = time.monotonic() - 60, None
+    started = time.monotonic()
+    index.get_by_slug("old-post")
+    assert time.monotonic() - started < 1
+    index.upsert({"id": "4", "slug": "new-post", "url": "/new-post/", "status": "published"})
+    ghost.gate.set()
+    for _ in range(100):
+        if index.stats()["syncs"] == 2:
+            break
+        time.sleep(0.01)
+    assert index._slugs == {"flask-routes": "1", "new-post": "4"}
@@ -0,0 +1,39 @@
+"""Test rendering of image variants."""
+
+import os
+import resource
+
+import pytest
+from PIL import Image
+
+from imaging import ImageVariant, resize_image
+
+
+def test_resize_image_partial_failure(tmp_path):
+    """A variant whose encoder fails is reported without losing the variants rendered alongside it."""
+    source_path = str(tmp_path / "source")
+    Image.new("RGB", (400, 300), (200, 10, 10)).save(source_path, format="JPEG")
+    outputs = [
+        (str(tmp_path / "mobile"), ImageVariant("mobile", "_mobile", scale=0.5, format="JPEG")),
+        (str(tmp_path / "webp"), ImageVariant("webp", "_webp", format="WEBP", quality=80, suffix="")),
+        (str(tmp_path / "broken"), ImageVariant("broken", "_broken", format="NOT-A-FORMAT", suffix="")),
+    ]
+    _, failures = resize_image(source_path, outputs)
+    assert list(failures) == ["broken"]
+    with Image.open(outputs[0][0]) as mobile, Image.open(outputs[1][0]) as webp:
+        assert mobile.size == (200, 150)
+        assert webp.size == (400, 300)
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/clear_refs"), reason="Peak RSS can only be reset on Linux.")
+def test_resize_image_peak_rss(tmp_path):
+    """The reported peak RSS covers the image being rendered rather than earlier work in the same process."""
+    source_path = str(tmp_path / "source")
+    Image.new("RGB", (40, 30)).save(source_path, format="JPEG")
+    earlier_work = b"\x01" * (256 * 1024 * 1024)
+    del earlier_work
+    earlier_peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_rss_kb, _ = resize_image(
+        source_path, [(str(tmp_path / "mobile"), ImageVariant("mobile", "_mobile", scale=0.5))]
+    )
+    assert peak_rss_kb < earlier_peak_rss_kb - 128 * 1024
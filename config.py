@@ -3,6 +3,7 @@
 import datetime
 import json
 from os import getenv, path
+from typing import Optional
 
 from dotenv import load_dotenv
 from fastapi_mail import ConnectionConfig
@@ -50,6 +51,17 @@ class Settings(BaseSettings):
     SQLALCHEMY_DATABASE_PEM: str = getenv("SQLALCHEMY_DATABASE_PEM")
     SQLALCHEMY_TRACK_MODIFICATIONS: bool = False
     SQLALCHEMY_ENGINE_OPTIONS: dict = {"ssl": {"key": SQLALCHEMY_DATABASE_PEM}}
+    SQLALCHEMY_POOL_SIZE: int = int(getenv("SQLALCHEMY_POOL_SIZE", "5"))
+    SQLALCHEMY_MAX_OVERFLOW: int = int(getenv("SQLALCHEMY_MAX_OVERFLOW", "5"))
+    SQLALCHEMY_SYNC_POOL_SIZE: int = int(getenv("SQLALCHEMY_SYNC_POOL_SIZE", "2"))
+    SQLALCHEMY_POOL_RECYCLE: int = int(getenv("SQLALCHEMY_POOL_RECYCLE", "1800"))
+    SQLALCHEMY_POOL_PRE_PING: bool = getenv("SQLALCHEMY_POOL_PRE_PING", "true").lower() == "true"
+    SQLALCHEMY_REPLICA_DATABASE_URI: Optional[str] = getenv("SQLALCHEMY_REPLICA_DATABASE_URI")
+    SQL_REWRITE_CHUNK_SIZE: int = int(getenv("SQL_REWRITE_CHUNK_SIZE", "500"))
+    SQL_REWRITE_PAUSE: float = float(getenv("SQL_REWRITE_PAUSE", "0.1"))
+    SQL_REWRITE_LOCK_WAIT_TIMEOUT: int = int(getenv("SQL_REWRITE_LOCK_WAIT_TIMEOUT", "5"))
+    SQL_REWRITE_MAX_LOCK_WAITS: int = int(getenv("SQL_REWRITE_MAX_LOCK_WAITS", "0"))
+    SQL_REWRITE_MAX_REPLICA_LAG: float = float(getenv("SQL_REWRITE_MAX_REPLICA_LAG", "5"))
 
     # Algolia API
     ALGOLIA_SEARCHES_ENDPOINT: str = "https://analytics.algolia.com/2/searches"
@@ -72,6 +84,14 @@ class Settings(BaseSettings):
     GCP_BUCKET_URL: str = getenv("GCP_BUCKET_URL")
     GCP_BUCKET_NAME: str = getenv("GCP_BUCKET_NAME")
     GCP_BUCKET_FOLDER: list = [f'{dt.year}/{dt.strftime("%m")}']
+    GCP_IMAGE_IO_WORKERS: int = int(getenv("GCP_IMAGE_IO_WORKERS", "8"))
+    GCP_IMAGE_CPU_WORKERS: int = int(getenv("GCP_IMAGE_CPU_WORKERS", "0"))
+    GCP_IMAGE_TIMEOUT: float = float(getenv("GCP_IMAGE_TIMEOUT", "120"))
+    GCP_IMAGE_QUALITY_PRESET: str = getenv("GCP_IMAGE_QUALITY_PRESET", "balanced")
+    GCP_IMAGE_AVIF: bool = getenv("GCP_IMAGE_AVIF", "false").lower() == "true"
+    GCP_IMAGE_CACHE_CONTROL: str = getenv("GCP_IMAGE_CACHE_CONTROL", "public, max-age=31536000")
+    IMAGE_QUEUE_PATH: str = getenv("IMAGE_QUEUE_PATH", path.join(BASE_DIR, "image_queue.sqlite3"))
+    IMAGE_QUEUE_WORKERS: int = int(getenv("IMAGE_QUEUE_WORKERS", "2"))
 
     # Plausible Analytics
     PLAUSIBLE_STATS_ENDPOINT: str = "https://plausible.io/api/v1/stats/breakdown"
@@ -88,6 +108,15 @@ class Settings(BaseSettings):
     GHOST_ADMIN_API_KEY: str = getenv("GHOST_ADMIN_API_KEY")
     GHOST_CONTENT_API_KEY: str = getenv("GHOST_CONTENT_API_KEY")
     GHOST_API_EXPORT_URL: str = f"{GHOST_BASE_URL}/admin/db/"
+    GHOST_HTTP_POOL_SIZE: int = int(getenv("GHOST_HTTP_POOL_SIZE", "20"))
+    GHOST_HTTP_KEEPALIVE_EXPIRY: float = float(getenv("GHOST_HTTP_KEEPALIVE_EXPIRY", "60"))
+    GHOST_HTTP2: bool = getenv("GHOST_HTTP2", "true").lower() == "true"
+    GHOST_RATE_LIMIT: float = float(getenv("GHOST_RATE_LIMIT", "10"))
+    GHOST_MAX_RETRIES: int = int(getenv("GHOST_MAX_RETRIES", "3"))
+    GHOST_BULK_WORKERS: int = int(getenv("GHOST_BULK_WORKERS", "8"))
+    GHOST_INDEX_TTL: float = float(getenv("GHOST_INDEX_TTL", "3600"))
+    GHOST_INDEX_MAX_SIZE: int = int(getenv("GHOST_INDEX_MAX_SIZE", "5000"))
+    GHOST_INDEX_SYNC_INTERVAL: float = float(getenv("GHOST_INDEX_SYNC_INTERVAL", "300"))
 
     GHOST_ADMIN_USER_ID: str = "1"
 
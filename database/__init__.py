@@ -1,17 +1,43 @@
 """Initialize custom Database clients for direct read/write access."""
 
-from sqlalchemy import create_engine
+from os import path
+from typing import AsyncIterator
+
+from databases.core import Connection
 from sqlalchemy.orm import declarative_base, sessionmaker
 
-from config import Settings, settings
+from config import settings
+
+from .async_db import AsyncDatabase
+from .registry import QueryRegistry
+from .sql_db import Database, create_pooled_engine
 
-from .sql_db import Database
+# Connections each database may hold per API worker process, split between its sync & async pools.
+# Request handlers use the async pools; the sync engines only serve ORM sessions & pandas batch jobs.
+CONNECTION_BUDGET = settings.SQLALCHEMY_POOL_SIZE + settings.SQLALCHEMY_MAX_OVERFLOW
+SYNC_POOL_SIZE = max(min(settings.SQLALCHEMY_SYNC_POOL_SIZE, CONNECTION_BUDGET - 1), 1)
+ASYNC_POOL_SIZE = max(CONNECTION_BUDGET - SYNC_POOL_SIZE, 1)
 
-# Create SQL Engine
-engine = create_engine(
-    f"{settings.SQLALCHEMY_DATABASE_URI}/{settings.SQLALCHEMY_FEATURES_DATABASE_NAME}",
-    connect_args=settings.SQLALCHEMY_ENGINE_OPTIONS,
-    echo=False,
+# Pool sizing applied to the sync engine of each database
+POOL_OPTIONS = {
+    "pool_size": SYNC_POOL_SIZE,
+    "max_overflow": 0,
+    "pool_recycle": settings.SQLALCHEMY_POOL_RECYCLE,
+    "pool_pre_ping": settings.SQLALCHEMY_POOL_PRE_PING,
+}
+
+# Create SQL Engine (one connection pool per database)
+engine = create_pooled_engine(
+    settings.SQLALCHEMY_DATABASE_URI,
+    settings.SQLALCHEMY_FEATURES_DATABASE_NAME,
+    settings.SQLALCHEMY_ENGINE_OPTIONS,
+    **POOL_OPTIONS,
+)
+ghost_engine = create_pooled_engine(
+    settings.SQLALCHEMY_DATABASE_URI,
+    settings.SQLALCHEMY_GHOST_DATABASE_NAME,
+    settings.SQLALCHEMY_ENGINE_OPTIONS,
+    **POOL_OPTIONS,
 )
 
 # Create SQL Session
@@ -30,15 +56,103 @@ def get_db():
 
 
 # Ghost database connection
-ghost_db = Database(
-    uri=Settings().SQLALCHEMY_DATABASE_URI,
-    db_name=Settings().SQLALCHEMY_GHOST_DATABASE_NAME,
-    args=Settings().SQLALCHEMY_ENGINE_OPTIONS,
+ghost_db = Database(engine=ghost_engine)
+
+# Feature database connection (shares the ORM session pool)
+feature_db = Database(engine=engine)
+
+# Async connection pools, opened & closed with the API lifespan
+ghost_async_db = AsyncDatabase(
+    uri=settings.SQLALCHEMY_DATABASE_URI,
+    db_name=settings.SQLALCHEMY_GHOST_DATABASE_NAME,
+    args=settings.SQLALCHEMY_ENGINE_OPTIONS,
+    max_size=ASYNC_POOL_SIZE,
+    pool_recycle=settings.SQLALCHEMY_POOL_RECYCLE,
+)
+feature_async_db = AsyncDatabase(
+    uri=settings.SQLALCHEMY_DATABASE_URI,
+    db_name=settings.SQLALCHEMY_FEATURES_DATABASE_NAME,
+    args=settings.SQLALCHEMY_ENGINE_OPTIONS,
+    max_size=ASYNC_POOL_SIZE,
+    pool_recycle=settings.SQLALCHEMY_POOL_RECYCLE,
 )
 
-# Feature database connection
-feature_db = Database(
-    uri=Settings().SQLALCHEMY_DATABASE_URI,
-    db_name=Settings().SQLALCHEMY_FEATURES_DATABASE_NAME,
-    args=Settings().SQLALCHEMY_ENGINE_OPTIONS,
+ghost_replica_db = (
+    AsyncDatabase(
+        uri=settings.SQLALCHEMY_REPLICA_DATABASE_URI,
+        db_name=settings.SQLALCHEMY_GHOST_DATABASE_NAME,
+        args=settings.SQLALCHEMY_ENGINE_OPTIONS,
+        max_size=1,
+        pool_recycle=settings.SQLALCHEMY_POOL_RECYCLE,
+    )
+    if settings.SQLALCHEMY_REPLICA_DATABASE_URI
+    else None
+)
+
+
+# Async database connection dependency
+async def get_async_db() -> AsyncIterator[Connection]:
+    async with feature_async_db.connection() as connection:
+        yield connection
+
+
+async def connect_databases() -> None:
+    """Open async connection pools."""
+    await ghost_async_db.connect()
+    await feature_async_db.connect()
+    if ghost_replica_db is not None:
+        await ghost_replica_db.connect()
+
+
+async def disconnect_databases() -> None:
+    """Close async connection pools."""
+    await ghost_async_db.disconnect()
+    await feature_async_db.disconnect()
+    if ghost_replica_db is not None:
+        await ghost_replica_db.disconnect()
+
+
+# SQL queries under `database/queries`, reloaded on change in development
+queries = QueryRegistry(
+    root=path.join(settings.BASE_DIR, "database", "queries"),
+    hot_reload=settings.ENVIRONMENT == "development",
+)
+
+
+def pool_stats() -> dict:
+    """
+    Connection pool utilization of each database, for both its sync & async pools.
+
+    :returns: dict
+    """
+    stats = {
+        settings.SQLALCHEMY_GHOST_DATABASE_NAME: {"sync": ghost_db.pool_stats(), "async": ghost_async_db.pool_stats()},
+        settings.SQLALCHEMY_FEATURES_DATABASE_NAME: {
+            "sync": feature_db.pool_stats(),
+            "async": feature_async_db.pool_stats(),
+        },
+    }
+    if ghost_replica_db is not None:
+        stats["replica"] = {"async": ghost_replica_db.pool_stats()}
+    return stats
+
+
+def dispose_engines() -> None:
+    """Close all pooled database connections."""
+    ghost_engine.dispose()
+    engine.dispose()
+
+
+# Chunked rewrites of large Ghost text columns, checkpointed in the features database
+from .rewrite import ColumnRewrite, RewriteEngine  # noqa: E402
+
+rewrites = RewriteEngine(
+    database=ghost_async_db,
+    checkpoints=feature_async_db,
+    replica=ghost_replica_db,
+    chunk_size=settings.SQL_REWRITE_CHUNK_SIZE,
+    pause=settings.SQL_REWRITE_PAUSE,
+    lock_wait_timeout=settings.SQL_REWRITE_LOCK_WAIT_TIMEOUT,
+    max_lock_waits=settings.SQL_REWRITE_MAX_LOCK_WAITS,
+    max_replica_lag=settings.SQL_REWRITE_MAX_REPLICA_LAG,
 )
@@ -1,62 +1,77 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional
 
+from databases.core import Connection
+from pymysql.err import IntegrityError, MySQLError
+from sqlalchemy import insert, select
 from sqlalchemy.engine.result import Result
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from database.models import Account, Donation
+from database.models import Account, Donation, ImageManifest
 from database.schemas import CoffeeDonation
 from log import LOGGER
 
 
-def get_donation(db: Session, donation: CoffeeDonation) -> Optional[CoffeeDonation]:
+async def get_donation(db: Connection, donation: CoffeeDonation) -> Optional[CoffeeDonation]:
     """
     Fetch BuyMeACoffee donation by ID.
 
-    :param Session db: ORM database session.
+    :param Connection db: Async database connection.
     :param NewDonation donation: Donation record to be fetched.
 
     :returns: Optional[NewDonation]
     """
-    existing_donation = db.query(Donation).filter(Donation.coffee_id == donation.coffee_id).first()
+    existing_donation = await db.fetch_one(select(Donation).where(Donation.coffee_id == donation.coffee_id))
     if existing_donation is None:
         return donation
     LOGGER.warning(f"Donation `{existing_donation.id}` from `{existing_donation.email}` already exists; skipping.")
     return None
 
 
-def create_donation(db: Session, donation: CoffeeDonation) -> Donation:
+async def create_donation(db: Connection, donation: CoffeeDonation) -> Optional[CoffeeDonation]:
     """
     Create new BuyMeACoffee donation record.
 
-    :param Session db: ORM database session.
+    :param Connection db: Async database connection.
     :param NewDonation donation: Donation schema object.
 
-    :returns: Donation
+    :returns: Optional[NewDonation]
     """
     try:
-        db_item = Donation(
-            coffee_id=donation.coffee_id,
-            email=donation.email,
-            name=donation.name,
-            count=donation.count,
-            message=donation.message,
-            link=donation.link,
-            created_at=datetime.now(),
+        created_at = datetime.now()
+        await db.execute(
+            insert(Donation).values(
+                coffee_id=donation.coffee_id,
+                email=donation.email,
+                name=donation.name,
+                count=donation.count,
+                message=donation.message,
+                url=donation.link,
+                created_at=created_at,
+            )
         )
-        db.add(db_item)
-        db.commit()
         LOGGER.success(f"Successfully received donation: `{donation.count}` coffees from `{donation.name}`.")
-        return db_item
+        return donation.model_copy(update={"created_at": created_at})
     except IntegrityError as e:
         LOGGER.error(f"DB IntegrityError while creating donation record: {e}")
-    except SQLAlchemyError as e:
-        LOGGER.error(f"SQLAlchemyError while creating donation record: {e}")
+    except MySQLError as e:
+        LOGGER.error(f"MySQLError while creating donation record: {e}")
     except Exception as e:
         LOGGER.error(f"Unexpected error while creating donation record: {e}")
 
 
+async def get_donations(db: Connection) -> List[Any]:
+    """
+    Fetch all BuyMeACoffee donations, oldest first.
+
+    :param Connection db: Async database connection.
+
+    :returns: List[Any]
+    """
+    return await db.fetch_all(select(Donation).order_by(Donation.created_at))
+
+
 def get_account(db: Session, account_email: str) -> Optional[Result]:
     """
     Fetch account by email address.
@@ -67,3 +82,44 @@ def get_account(db: Session, account_email: str) -> Optional[Result]:
     :returns: Optional[Result]
     """
     return db.query(Account).filter(Account.email == account_email).first()
+
+
+def get_image_manifests(db: Session, blob_names: Iterable[str]) -> Dict[str, ImageManifest]:
+    """
+    Fetch manifest records for source images, keyed by blob name.
+
+    :param Session db: ORM database session.
+    :param Iterable[str] blob_names: Full paths of source image blobs.
+
+    :returns: Dict[str, ImageManifest]
+    """
+    blob_names = list(blob_names)
+    manifests = {}
+    for i in range(0, len(blob_names), 500):
+        chunk = blob_names[i : i + 500]
+        for manifest in db.query(ImageManifest).filter(ImageManifest.blob_name.in_(chunk)):
+            manifests[manifest.blob_name] = manifest
+    return manifests
+
+
+def save_image_manifests(db: Session, manifests: List[dict]) -> int:
+    """
+    Create or update manifest records for source images.
+
+    :param Session db: ORM database session.
+    :param List[dict] manifests: Records containing `blob_name`, `generation`, `md5_hash` & `variants`.
+
+    :returns: int
+    """
+    try:
+        for manifest in manifests:
+            db.merge(ImageManifest(**manifest))
+        db.commit()
+        return len(manifests)
+    except SQLAlchemyError as e:
+        db.rollback()
+        LOGGER.error(f"SQLAlchemyError while saving image manifest: {e}")
+    except Exception as e:
+        db.rollback()
+        LOGGER.error(f"Unexpected error while saving image manifest: {e}")
+    return 0
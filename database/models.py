@@ -1,6 +1,6 @@
 """Data models."""
 
-from sqlalchemy import Column, DateTime, Integer, String, Text
+from sqlalchemy import JSON, BigInteger, Boolean, Column, DateTime, Integer, String, Text
 from sqlalchemy.sql import func
 
 from database import Base
@@ -40,3 +40,33 @@ class Donation(Base):
 
     def __repr__(self):
         return f"<Donation {self.id}, ({self.url}): `{self.message}`>"
+
+
+class ImageManifest(Base):
+    """Source image on GCS along with the variants generated from it."""
+
+    __tablename__ = "image_manifest"
+
+    blob_name = Column(String(255), primary_key=True, index=True)
+    generation = Column(BigInteger, nullable=False)
+    md5_hash = Column(String(64))
+    variants = Column(JSON, default=list)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<ImageManifest {self.blob_name} ({self.generation}): {self.variants}>"
+
+
+class RewriteCheckpoint(Base):
+    """Progress of a chunked rewrite through a table, so an interrupted pass can resume."""
+
+    __tablename__ = "rewrite_checkpoint"
+
+    name = Column(String(255), primary_key=True, index=True)
+    last_key = Column(String(255))
+    rows_updated = Column(BigInteger, nullable=False, default=0)
+    completed = Column(Boolean, nullable=False, default=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<RewriteCheckpoint {self.name} ({self.last_key}): {self.rows_updated} rows>"
@@ -0,0 +1,19 @@
+SELECT
+	posts.id,
+	posts.slug,
+	posts.title,
+	posts.custom_excerpt,
+	posts.updated_at
+FROM
+	posts
+	LEFT JOIN posts_meta ON posts.id = posts_meta.post_id
+WHERE
+	posts.type = 'post'
+	AND posts.title IS NOT NULL
+	AND (posts_meta.post_id IS NULL
+		OR posts_meta.meta_title IS NULL
+		OR posts_meta.meta_description IS NULL
+		OR posts_meta.og_title IS NULL
+		OR posts_meta.og_description IS NULL
+		OR posts_meta.twitter_title IS NULL
+		OR posts_meta.twitter_description IS NULL);
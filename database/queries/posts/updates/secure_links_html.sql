@@ -1,6 +0,0 @@
-UPDATE
-	posts
-SET
-	html = REPLACE(html, 'http://', 'https://')
-WHERE
-	html LIKE '%%http://%%';
\ No newline at end of file
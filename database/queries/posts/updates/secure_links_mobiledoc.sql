@@ -1,6 +0,0 @@
-UPDATE
-	posts
-SET
-	mobiledoc = REPLACE(mobiledoc, 'http://', 'https://')
-WHERE
-	mobiledoc LIKE '%%http://%%';
\ No newline at end of file
@@ -1,6 +0,0 @@
-UPDATE
-	posts
-SET
-	plaintext = REPLACE(plaintext, 'http://', 'https://')
-WHERE
-	plaintext LIKE '%%http://%%';
\ No newline at end of file
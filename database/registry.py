@@ -0,0 +1,166 @@
+"""Registry of SQL queries under `database/queries`, loaded & compiled once per process."""
+
+import hashlib
+import threading
+from os import path, scandir
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
+
+from log import LOGGER
+
+
+class SQLQuery(NamedTuple):
+    """A `.sql` file compiled into an executable statement."""
+
+    name: str
+    path: str
+    sql: str
+    statement: TextClause
+    digest: str
+    mtime: float
+
+
+class QueryRegistry:
+    """SQL queries addressable by `subdirectory/name` (ie: `posts/selects/get_comments`)."""
+
+    def __init__(self, root: str, hot_reload: bool = False):
+        """
+        :param str root: Directory containing `.sql` files, optionally nested in subdirectories.
+        :param bool hot_reload: Re-read files whose mtime changed before each lookup (development only).
+        """
+        self.root = root
+        self.hot_reload = hot_reload
+        self._queries: Dict[str, SQLQuery] = {}
+        self._digests: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def __contains__(self, name: str) -> bool:
+        self._refresh()
+        return name in self._queries
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def __getitem__(self, name: str) -> TextClause:
+        return self.get(name).statement
+
+    def load(self) -> int:
+        """
+        Read & compile every `.sql` file beneath `root`, reusing queries whose file is unchanged.
+
+        :returns: int
+        """
+        with self._lock:
+            loaded = {}
+            changed = 0
+            for name, file_path, mtime in self._scan():
+                query = self._queries.get(name)
+                if query is None or query.mtime != mtime:
+                    query = self._compile(name, file_path, mtime)
+                    changed += 1
+                loaded[name] = query
+            self._queries = loaded
+            self._digests = {query.digest: name for name, query in loaded.items()}
+        if changed:
+            LOGGER.info(f"Loaded {changed} of {len(loaded)} SQL queries from `{self.root}`.")
+        return changed
+
+    def get(self, name: str) -> SQLQuery:
+        """
+        Fetch a compiled query by `subdirectory/name`, without the `.sql` extension.
+
+        :param str name: Path of query relative to `root` (ie: `analytics/weekly`).
+
+        :returns: SQLQuery
+        """
+        self._refresh()
+        query = self._queries.get(name)
+        if query is None:
+            raise KeyError(f"No SQL query named `{name}` in `{self.root}`.")
+        return query
+
+    def sql(self, name: str) -> str:
+        """
+        Raw SQL of a query, for clients which don't accept SQLAlchemy statements (ie: BigQuery).
+
+        :param str name: Path of query relative to `root` (ie: `analytics/weekly`).
+
+        :returns: str
+        """
+        return self.get(name).sql
+
+    def by_digest(self, digest: str) -> Optional[SQLQuery]:
+        """
+        Fetch a query by the SHA-256 digest of its SQL.
+
+        :param str digest: Hex digest of query contents.
+
+        :returns: Optional[SQLQuery]
+        """
+        self._refresh()
+        name = self._digests.get(digest)
+        return self._queries.get(name) if name else None
+
+    def collection(self, subdirectory: str) -> Dict[str, TextClause]:
+        """
+        Statements stored directly within a subdirectory, keyed by query name.
+
+        :param str subdirectory: Subdirectory of `root` containing queries to run in bulk (ie: `tags`).
+
+        :returns: Dict[str, TextClause]
+        """
+        self._refresh()
+        prefix = f"{subdirectory.strip('/')}/"
+        return {
+            name[len(prefix) :]: query.statement
+            for name, query in self._queries.items()
+            if name.startswith(prefix) and "/" not in name[len(prefix) :]
+        }
+
+    def names(self) -> List[str]:
+        """
+        Names of every registered query.
+
+        :returns: List[str]
+        """
+        return sorted(self._queries)
+
+    def _refresh(self) -> None:
+        """Pick up edited, added or removed `.sql` files when hot reloading is enabled."""
+        if self.hot_reload:
+            self.load()
+
+    def _scan(self, directory: Optional[str] = None) -> Iterator[tuple]:
+        """
+        Walk `root` for `.sql` files.
+
+        :param Optional[str] directory: Directory to walk; defaults to `root`.
+
+        :returns: Iterator[tuple]
+        """
+        with scandir(directory or self.root) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    yield from self._scan(entry.path)
+                elif entry.is_file() and entry.name.endswith(".sql"):
+                    name = path.relpath(entry.path, self.root)[: -len(".sql")].replace(path.sep, "/")
+                    yield name, entry.path, entry.stat().st_mtime
+
+    @staticmethod
+    def _compile(name: str, file_path: str, mtime: float) -> SQLQuery:
+        """
+        Read a `.sql` file & compile it into a `text()` construct.
+
+        :param str name: Path of query relative to `root`.
+        :param str file_path: Absolute path of `.sql` file.
+        :param float mtime: Modification time of file when it was scanned.
+
+        :returns: SQLQuery
+        """
+        with open(file_path, "r", encoding="utf-8") as f:
+            sql = f.read()
+        digest = hashlib.sha256(sql.encode("utf-8")).hexdigest()
+        return SQLQuery(name=name, path=file_path, sql=sql, statement=text(sql), digest=digest, mtime=mtime)
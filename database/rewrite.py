@@ -0,0 +1,247 @@
+"""Chunked, resumable rewrites of large text columns which don't hold locks across whole tables."""
+
+import asyncio
+import time
+from typing import NamedTuple, Optional
+
+from databases.core import Connection
+from pymysql.err import MySQLError
+from sqlalchemy import column, func, select, table, text, update
+from sqlalchemy.dialects.mysql import insert
+from sqlalchemy.sql.expression import TableClause
+
+from database.async_db import AsyncDatabase, record_to_dict
+from database.models import RewriteCheckpoint
+from database.sql_db import DEADLOCK_ERROR_CODE
+from log import LOGGER
+
+# MySQL error raised when a statement gives up waiting for a row lock.
+LOCK_WAIT_TIMEOUT_ERROR_CODE = 1205
+
+# Seconds a session waits for a row lock before giving up.
+LOCK_WAIT_TIMEOUT_STATEMENT = text("SET SESSION innodb_lock_wait_timeout = :timeout")
+
+
+class ColumnRewrite(NamedTuple):
+    """Replace every occurrence of a substring within a column (ie: `http://` -> `https://` in `posts.html`)."""
+
+    name: str
+    table: str
+    column: str
+    search: str
+    replace: str
+    key: str = "id"
+
+
+class RewriteEngine:
+    """Applies `ColumnRewrite`s in primary-key order, one short transaction per chunk."""
+
+    def __init__(
+        self,
+        database: AsyncDatabase,
+        checkpoints: AsyncDatabase,
+        replica: Optional[AsyncDatabase] = None,
+        chunk_size: int = 500,
+        pause: float = 0.1,
+        lock_wait_timeout: int = 5,
+        max_lock_waits: int = 0,
+        max_replica_lag: float = 5,
+        max_attempts: int = 5,
+    ):
+        """
+        :param AsyncDatabase database: Database containing the tables to rewrite.
+        :param AsyncDatabase checkpoints: Database holding the `rewrite_checkpoint` table.
+        :param Optional[AsyncDatabase] replica: Replica of `database` whose lag throttles chunks, if any.
+        :param int chunk_size: Maximum number of rows (by primary key) examined per transaction.
+        :param float pause: Seconds to sleep between chunks.
+        :param int lock_wait_timeout: Seconds a chunk waits on a row lock before backing off & retrying.
+        :param int max_lock_waits: Transactions allowed to be waiting on row locks before chunks are paused.
+        :param float max_replica_lag: Seconds of replication lag tolerated before chunks are paused.
+        :param int max_attempts: Times a chunk is attempted when it times out waiting for locks or deadlocks.
+        """
+        self.database = database
+        self.checkpoints = checkpoints
+        self.replica = replica
+        self.chunk_size = chunk_size
+        self.pause = pause
+        self.lock_wait_timeout = lock_wait_timeout
+        self.max_lock_waits = max_lock_waits
+        self.max_replica_lag = max_replica_lag
+        self.max_attempts = max_attempts
+
+    async def run(self, rewrite: ColumnRewrite) -> dict:
+        """
+        Apply a rewrite to every matching row, resuming after the last committed chunk of an unfinished pass.
+
+        :param ColumnRewrite rewrite: Column & substitution to apply.
+
+        :returns: dict
+        """
+        started = time.perf_counter()
+        checkpoint = await self._load_checkpoint(rewrite.name)
+        resumed = checkpoint is not None and not checkpoint.completed
+        last_key = checkpoint.last_key if resumed else None
+        rows_updated = checkpoint.rows_updated if resumed else 0
+        summary = {"rows": 0, "chunks": 0, "throttled_seconds": 0.0, "resumed_from": last_key}
+        async with self.database.connection() as conn:
+            previous_timeout = await conn.fetch_val(text("SELECT @@SESSION.innodb_lock_wait_timeout"))
+            await conn.execute(LOCK_WAIT_TIMEOUT_STATEMENT.bindparams(timeout=int(self.lock_wait_timeout)))
+            try:
+                while True:
+                    upper_key = await self._chunk_upper_key(conn, rewrite, last_key)
+                    if upper_key is None:
+                        break
+                    rowcount = await self._rewrite_chunk(conn, rewrite, last_key, upper_key)
+                    last_key = upper_key
+                    rows_updated += rowcount
+                    summary["rows"] += rowcount
+                    summary["chunks"] += 1
+                    await self._save_checkpoint(rewrite.name, last_key, rows_updated, completed=False)
+                    summary["throttled_seconds"] += await self._throttle(conn)
+            finally:
+                # The connection returns to the pool shared with request handlers; restore its session setting.
+                await conn.execute(LOCK_WAIT_TIMEOUT_STATEMENT.bindparams(timeout=int(previous_timeout)))
+        await self._save_checkpoint(rewrite.name, last_key, rows_updated, completed=True)
+        summary["seconds"] = round(time.perf_counter() - started, 3)
+        summary["throttled_seconds"] = round(summary["throttled_seconds"], 3)
+        LOGGER.success(
+            f"Rewrote {summary['rows']} rows of `{rewrite.table}.{rewrite.column}` for `{rewrite.name}` "
+            f"in {summary['chunks']} chunks ({summary['seconds']}s)."
+        )
+        return summary
+
+    async def _chunk_upper_key(
+        self, conn: Connection, rewrite: ColumnRewrite, last_key: Optional[str]
+    ) -> Optional[str]:
+        """
+        Highest primary key of the next chunk, read from the primary key index alone.
+
+        :param Connection conn: Connection to the database being rewritten.
+        :param ColumnRewrite rewrite: Rewrite being applied.
+        :param Optional[str] last_key: Highest primary key of the previous chunk.
+
+        :returns: Optional[str]
+        """
+        key = self._table(rewrite).c[rewrite.key]
+        query = select(key).order_by(key).limit(self.chunk_size)
+        if last_key is not None:
+            query = query.where(key > last_key)
+        rows = await conn.fetch_all(query)
+        return rows[-1][0] if rows else None
+
+    async def _rewrite_chunk(
+        self, conn: Connection, rewrite: ColumnRewrite, last_key: Optional[str], upper_key: str
+    ) -> int:
+        """
+        Rewrite matching rows within a primary key range in a transaction of its own.
+
+        :param Connection conn: Connection to the database being rewritten.
+        :param ColumnRewrite rewrite: Rewrite being applied.
+        :param Optional[str] last_key: Exclusive lower bound of the chunk.
+        :param str upper_key: Inclusive upper bound of the chunk.
+
+        :returns: int
+        """
+        rewritten = self._table(rewrite)
+        key, target = rewritten.c[rewrite.key], rewritten.c[rewrite.column]
+        statement = (
+            update(rewritten)
+            .where(key <= upper_key, func.instr(target, rewrite.search) > 0)
+            .values({rewrite.column: func.replace(target, rewrite.search, rewrite.replace)})
+        )
+        if last_key is not None:
+            statement = statement.where(key > last_key)
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                async with conn.transaction():
+                    return await conn.execute(statement)
+            except MySQLError as e:
+                retryable = bool(e.args) and e.args[0] in (LOCK_WAIT_TIMEOUT_ERROR_CODE, DEADLOCK_ERROR_CODE)
+                if not retryable or attempt == self.max_attempts:
+                    raise
+                LOGGER.warning(f"Chunk of `{rewrite.name}` ending at `{upper_key}` hit {e}; backing off.")
+                await asyncio.sleep(self.pause * 2**attempt)
+
+    @staticmethod
+    def _table(rewrite: ColumnRewrite) -> TableClause:
+        """
+        Lightweight table construct holding the primary key & rewritten column.
+
+        :param ColumnRewrite rewrite: Rewrite being applied.
+
+        :returns: TableClause
+        """
+        return table(rewrite.table, column(rewrite.key), column(rewrite.column))
+
+    async def _throttle(self, conn: Connection) -> float:
+        """
+        Sleep between chunks, for longer while Ghost's writes are queued behind locks or the replica lags.
+
+        :param Connection conn: Connection to the database being rewritten.
+
+        :returns: float
+        """
+        waited = 0.0
+        delay = self.pause
+        for _ in range(self.max_attempts):
+            lock_waits = await self._lock_waits(conn)
+            replica_lag = await self._replica_lag()
+            if lock_waits <= self.max_lock_waits and (replica_lag is None or replica_lag <= self.max_replica_lag):
+                break
+            LOGGER.info(f"Throttling rewrite ({lock_waits} lock waits, {replica_lag}s replica lag).")
+            await asyncio.sleep(delay)
+            waited += delay
+            delay *= 2
+        await asyncio.sleep(self.pause)
+        return waited + self.pause
+
+    @staticmethod
+    async def _lock_waits(conn: Connection) -> int:
+        """
+        Number of transactions currently waiting on InnoDB row locks.
+
+        :param Connection conn: Connection to the database being rewritten.
+
+        :returns: int
+        """
+        row = await conn.fetch_one(text("SHOW GLOBAL STATUS LIKE 'Innodb_row_lock_current_waits'"))
+        return int(row[1]) if row else 0
+
+    async def _replica_lag(self) -> Optional[float]:
+        """
+        Seconds the replica is behind, if a replica is configured & replicating.
+
+        :returns: Optional[float]
+        """
+        if self.replica is None:
+            return None
+        row = await self.replica.db.fetch_one(text("SHOW REPLICA STATUS"))
+        if row is None:
+            return None
+        status = record_to_dict(row)
+        lag = status.get("Seconds_Behind_Source", status.get("Seconds_Behind_Master"))
+        return float(lag) if lag is not None else None
+
+    async def _load_checkpoint(self, name: str) -> Optional[RewriteCheckpoint]:
+        """
+        Progress of the most recent pass of a rewrite.
+
+        :param str name: Name of rewrite.
+
+        :returns: Optional[RewriteCheckpoint]
+        """
+        checkpoints = RewriteCheckpoint.__table__
+        return await self.checkpoints.db.fetch_one(select(checkpoints).where(checkpoints.c.name == name))
+
+    async def _save_checkpoint(self, name: str, last_key: Optional[str], rows_updated: int, completed: bool) -> None:
+        """
+        Record the last committed chunk of a rewrite.
+
+        :param str name: Name of rewrite.
+        :param Optional[str] last_key: Highest primary key rewritten so far.
+        :param int rows_updated: Rows changed so far during this pass.
+        :param bool completed: Whether the pass reached the end of the table.
+        """
+        values = {"last_key": last_key, "rows_updated": rows_updated, "completed": completed}
+        statement = insert(RewriteCheckpoint.__table__).values(name=name, **values).on_duplicate_key_update(**values)
+        await self.checkpoints.db.execute(statement)
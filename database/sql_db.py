@@ -1,23 +1,171 @@
 """Database client."""
 
-from typing import List, Optional
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Union
 
 from pandas import DataFrame
 from sqlalchemy import MetaData, Table, create_engine, text
-from sqlalchemy.engine import CursorResult
+from sqlalchemy.engine import CursorResult, Engine
 from sqlalchemy.engine.result import Result
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.sql.elements import TextClause
 
 from log import LOGGER
 
 metadata_obj = MetaData()
 
+# Queries sharing a stem with numbered suffixes run in numeric order (ie: `feature_image_cdn_urls_1` then `_2`).
+NUMBERED_QUERY_PATTERN = re.compile(r"^(?P<stem>.+)_(?P<position>[0-9]+)$")
+
+# Isolation level of batch lanes; InnoDB then only locks rows a statement actually changes.
+BATCH_ISOLATION_LEVEL = "READ COMMITTED"
+
+# MySQL error raised when InnoDB rolls back a transaction to break a deadlock, & attempts made per lane.
+DEADLOCK_ERROR_CODE = 1213
+LANE_ATTEMPTS = 2
+
+
+def query_lanes(names: Iterable[str], groups: Iterable[Sequence[str]] = ()) -> List[List[str]]:
+    """
+    Split a batch of queries into lanes which may run concurrently; queries within a lane run in order.
+
+    Each declared group becomes a lane (queries which conflict or depend on one another), as does each set of
+    numbered queries sharing a stem. Every other query gets a lane of its own.
+
+    :param Iterable[str] names: Names of queries in the batch.
+    :param Iterable[Sequence[str]] groups: Ordered groups of query names which must not run concurrently.
+
+    :returns: List[List[str]]
+    """
+    names = list(names)
+    remaining = dict.fromkeys(names)
+    lanes = []
+    for group in groups:
+        lane = [name for name in group if name in remaining]
+        for name in lane:
+            del remaining[name]
+        if lane:
+            lanes.append(lane)
+    numbered: Dict[str, List[tuple]] = {}
+    for name in remaining:
+        match = NUMBERED_QUERY_PATTERN.match(name)
+        if match:
+            numbered.setdefault(match.group("stem"), []).append((int(match.group("position")), name))
+    for stem, positions in numbered.items():
+        if len(positions) > 1:
+            lanes.append([name for _, name in sorted(positions)])
+            for _, name in positions:
+                del remaining[name]
+    lanes.extend([name] for name in remaining)
+    return lanes
+
+
+def lane_failure(lane: Sequence[str], failed: str, error: Exception) -> Dict[str, dict]:
+    """
+    Results for a lane whose transaction was rolled back.
+
+    :param Sequence[str] lane: Names of queries in the lane.
+    :param str failed: Name of query which raised.
+    :param Exception error: Error raised by the failing query.
+
+    :returns: Dict[str, dict]
+    """
+    return {name: {"error": str(error) if name == failed else f"Rolled back after `{failed}` failed."} for name in lane}
+
+
+def failed_queries(results: Dict[str, dict]) -> Dict[str, str]:
+    """
+    Errors of queries in a batch which failed or were rolled back.
+
+    :param Dict[str, dict] results: Results of a batch, keyed by query name.
+
+    :returns: Dict[str, str]
+    """
+    return {name: result["error"] for name, result in results.items() if "error" in result}
+
+
+def is_deadlock(error: Exception) -> bool:
+    """
+    Whether MySQL aborted a statement to resolve a deadlock.
+
+    :param Exception error: Error raised while executing a statement.
+
+    :returns: bool
+    """
+    error = getattr(error, "orig", error)
+    return bool(getattr(error, "args", None)) and error.args[0] == DEADLOCK_ERROR_CODE
+
+
+def create_pooled_engine(
+    uri: str,
+    db_name: str,
+    args: dict,
+    pool_size: int = 5,
+    max_overflow: int = 5,
+    pool_recycle: int = 1800,
+    pool_pre_ping: bool = True,
+) -> Engine:
+    """
+    Create an engine holding the connection pool of a single database.
+
+    :param str uri: Database server URI (without database name).
+    :param str db_name: Name of database to connect to.
+    :param dict args: Arguments passed to the DBAPI when connecting.
+    :param int pool_size: Connections kept open in the pool.
+    :param int max_overflow: Connections opened beyond `pool_size` under load & closed when returned.
+    :param int pool_recycle: Seconds after which a pooled connection is replaced.
+    :param bool pool_pre_ping: Test connections for liveness when they are checked out.
+
+    :returns: Engine
+    """
+    return create_engine(
+        f"{uri}/{db_name}",
+        connect_args=args,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pool_pre_ping,
+        echo=False,
+    )
+
 
 class Database:
     """Database client."""
 
-    def __init__(self, uri: str, db_name: str, args: dict):
-        self.db = create_engine(f"{uri}/{db_name}", connect_args=args, echo=False)
+    def __init__(
+        self,
+        uri: Optional[str] = None,
+        db_name: Optional[str] = None,
+        args: Optional[dict] = None,
+        engine: Optional[Engine] = None,
+    ):
+        """
+        :param Optional[str] uri: Database server URI; ignored when `engine` is provided.
+        :param Optional[str] db_name: Name of database; ignored when `engine` is provided.
+        :param Optional[dict] args: Arguments passed to the DBAPI; ignored when `engine` is provided.
+        :param Optional[Engine] engine: Existing engine whose connection pool should be shared.
+        """
+        self.db = engine if engine is not None else create_pooled_engine(uri, db_name, args or {})
+
+    def pool_stats(self) -> dict:
+        """
+        Utilization of the connection pool backing this client.
+
+        :returns: dict
+        """
+        pool = self.db.pool
+        if not hasattr(pool, "checkedout"):
+            return {"pool": type(pool).__name__}
+        capacity = self._pool_capacity()
+        return {
+            "pool": type(pool).__name__,
+            "size": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "utilization": round(pool.checkedout() / capacity, 3) if capacity else None,
+        }
 
     def _table(self, table_name: str) -> Table:
         """
@@ -29,37 +177,39 @@ class Database:
         """
         return Table(table_name, MetaData, autoload=True)
 
-    def execute_queries(self, queries: dict) -> dict:
+    def _pool_capacity(self) -> int:
         """
-        Execute collection of SQL analytics.
+        Maximum connections the pool will hand out at once.
 
-        :param dict queries: Map of query names -> SQL analytics.
+        :returns: int
+        """
+        pool = self.db.pool
+        if not hasattr(pool, "checkedout"):
+            return 1
+        return pool.size() + max(pool._max_overflow, 0)
 
-        :returns: dict
+    @staticmethod
+    def _statement(query: Union[str, TextClause]) -> TextClause:
         """
-        try:
-            results = {}
-            with self.db.begin() as conn:
-                for k, v in queries.items():
-                    query_result = conn.execute(v)
-                    results[k] = f"{query_result.rowcount} rows affected."
-                return results
-        except SQLAlchemyError as e:
-            LOGGER.error(f"SQLAlchemyError while executing queries `{','.join(queries.keys())}`: {e}")
-        except Exception as e:
-            LOGGER.error(f"Unexpected exception while executing queries `{','.join(queries.keys())}`: {e}")
+        Wrap raw SQL in a `text()` construct.
+
+        :param Union[str, TextClause] query: SQL query or statement.
+
+        :returns: TextClause
+        """
+        return text(query) if isinstance(query, str) else query
 
-    def execute_query(self, query: str) -> Optional[CursorResult]:
+    def execute_query(self, query: Union[str, TextClause]) -> Optional[CursorResult]:
         """
         Execute single SQL query.
 
-        :param str query: SQL query to run against database.
+        :param Union[str, TextClause] query: SQL query (or precompiled statement) to run against database.
 
         :returns: Optional[CursorResult]
         """
         try:
             with self.db.begin() as conn:
-                return conn.execute(text(query))
+                return conn.execute(self._statement(query))
         except SQLAlchemyError as e:
             LOGGER.error(f"Failed to execute SQL query {query}: {e}")
 
@@ -74,7 +224,7 @@ class Database:
         try:
             with self.db.begin() as conn:
                 with open(sql_file, "r", encoding="utf-8") as query:
-                    return conn.execute(text(query))
+                    return conn.execute(text(query.read()))
         except SQLAlchemyError as e:
             LOGGER.error(f"SQLAlchemyError while executing SQL `{sql_file}`: {e}")
             return f"Failed to execute SQL `{sql_file}`: {e}"
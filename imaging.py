@@ -0,0 +1,128 @@
+"""Image decoding & encoding run in worker processes; depends on nothing but Pillow so workers start quickly."""
+
+import resource
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from PIL import Image
+
+
+class ImageVariant(NamedTuple):
+    """Resized rendition of a standard-res image, stored in a subfolder beside it."""
+
+    name: str
+    subfolder: str
+    width: Optional[int] = None
+    scale: Optional[float] = None
+    format: Optional[str] = None
+    quality: Optional[int] = None
+    suffix: str = "@2x"
+    smaller_than_source: bool = False
+
+
+def variant_size(size: Tuple[int, int], variant: ImageVariant) -> Tuple[int, int]:
+    """
+    Dimensions of a variant for a source image, preserving aspect ratio and never upscaling.
+
+    :param Tuple[int, int] size: Width & height of the source image.
+    :param ImageVariant variant: Variant being generated.
+
+    :returns: Tuple[int, int]
+    """
+    width, height = size
+    if variant.width:
+        new_width = min(variant.width, width)
+    elif variant.scale:
+        new_width = max(round(width * variant.scale), 1)
+    else:
+        new_width = width
+    return new_width, max(round(height * new_width / width), 1)
+
+
+def resize_image(source_path: str, outputs: List[Tuple[str, ImageVariant]]) -> Tuple[int, Dict[str, str]]:
+    """
+    Write every requested variant of an image; runs in a worker process.
+
+    Full-size variants (ie: WebP siblings) are encoded from a full decode. Downscaled variants are rendered
+    from a separate decode which, for JPEGs, is reduced while decoding to just above the largest of them.
+    A variant which fails to render (ie: an unavailable AVIF encoder) doesn't prevent the others from being written.
+
+    Returns the peak RSS (KB) of the worker process while rendering this image; Pillow allocates pixel buffers
+    outside of Python's allocator, so `tracemalloc` can't measure them. Where the peak can't be reset (ie: outside
+    of Linux), the worker's lifetime peak is returned instead. Errors of variants which failed are returned
+    alongside it, keyed by variant name.
+
+    :param str source_path: Local file containing the encoded source image.
+    :param List[Tuple[str, ImageVariant]] outputs: Local file to write each variant to, with `format` resolved.
+
+    :returns: Tuple[int, Dict[str, str]]
+    """
+    _reset_peak_rss()
+    with Image.open(source_path) as im:
+        source_size = im.size
+    sized_outputs = [(output, variant_size(source_size, output[1])) for output in outputs]
+    full_size = [sized_output for sized_output in sized_outputs if sized_output[1] == source_size]
+    downscaled = [sized_output for sized_output in sized_outputs if sized_output[1] != source_size]
+    failures = {}
+    for group in (full_size, downscaled):
+        if group:
+            failures.update(_render_variants(source_path, group))
+    return _peak_rss_kb(), failures
+
+
+def _reset_peak_rss() -> None:
+    """Reset the process' peak RSS to its current RSS, so the next reading covers only work done since."""
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="utf-8") as clear_refs:
+            clear_refs.write("5")
+    except OSError:
+        pass
+
+
+def _peak_rss_kb() -> int:
+    """
+    Peak RSS (KB) of this process since it was last reset, falling back to its lifetime peak.
+
+    :returns: int
+    """
+    try:
+        with open("/proc/self/status", encoding="utf-8") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _render_variants(
+    source_path: str, sized_outputs: List[Tuple[Tuple[str, ImageVariant], Tuple[int, int]]]
+) -> Dict[str, str]:
+    """
+    Decode an image once and write variants largest first, each one downscaled from the previous result.
+
+    :param str source_path: Local file containing the encoded source image.
+    :param List[Tuple[Tuple[str, ImageVariant], Tuple[int, int]]] sized_outputs: Outputs paired with their dimensions.
+
+    :returns: Dict[str, str]
+    """
+    sized_outputs = sorted(sized_outputs, key=lambda sized_output: sized_output[1], reverse=True)
+    try:
+        with Image.open(source_path) as im:
+            if im.format == "JPEG":
+                im.draft(im.mode, sized_outputs[0][1])
+            current = im.copy()
+    except Exception as e:
+        return {variant.name: f"{type(e).__name__}: {e}" for (_, variant), _ in sized_outputs}
+    failures = {}
+    for (output_path, variant), size in sized_outputs:
+        try:
+            if current.size != size:
+                current = current.resize(size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+            rendered = (
+                current.convert("RGB") if variant.format == "JPEG" and current.mode not in ("RGB", "L") else current
+            )
+            save_options = {"quality": variant.quality} if variant.quality else {}
+            rendered.save(output_path, format=variant.format, **save_options)
+        except Exception as e:
+            failures[variant.name] = f"{type(e).__name__}: {e}"
+    return failures
@@ -1,7 +1,9 @@
 """Integration tests for API client."""
 
 import pprint
+from typing import Iterator
 
+import pytest
 from fastapi.testclient import TestClient
 from github import Github
 
@@ -10,21 +12,32 @@ from config import settings
 
 # from database.schemas import GhostMember, GhostSubscriber, NewDonation
 
-client = TestClient(create_app())
 pp = pprint.PrettyPrinter(indent=4)
 
 
-def test_api_docs():
+@pytest.fixture(scope="module")
+def client() -> Iterator[TestClient]:
+    """
+    Test client running the API's lifespan, so database pools & background workers start as they do in production.
+
+    :returns: Iterator[TestClient]
+    """
+    with TestClient(create_app()) as test_client:
+        yield test_client
+
+
+def test_api_docs(client: TestClient):
     """API docs health check."""
     response = client.get("/")
     assert response.status_code == 200
     assert response.headers.get("Content-Type") == "text/html; charset=utf-8"
 
 
-def test_github_pr(github_pr_owner: dict, github_pr_user: dict, gh: Github):
+def test_github_pr(client: TestClient, github_pr_owner: dict, github_pr_user: dict, gh: Github):
     """
     Create PR in `blog-webhook-api` repo & send SMS notification.
 
+    :param TestClient client: API test client.
     :param dict github_pr_owner: Github PR event payload for owner.
     :param dict github_pr_user: Github PR event payload for user.
     :param Github gh: Github API client.
@@ -46,10 +59,11 @@ def test_github_pr(github_pr_owner: dict, github_pr_user: dict, gh: Github):
     gh.get_repo(repo).get_pull(pr["id"]).edit(state="closed")
 
 
-def test_github_issue(github_issue_user: dict, gh: Github):
+def test_github_issue(client: TestClient, github_issue_user: dict, gh: Github):
     """
     Create issue in `blog-webhook-api` repo & send SMS notification.
 
+    :param TestClient client: API test client.
     :param dict github_issue_user: Github issue event payload for user.
     :param Github gh: Github API client.
     """
@@ -68,20 +82,20 @@ def test_github_issue(github_issue_user: dict, gh: Github):
             gh_issue.edit(state="closed")
 
 
-def test_batch_update_metadata():
+def test_batch_update_metadata(client: TestClient):
     """Test updating metadata for all posts."""
     response = client.get("/posts/")
     assert response.status_code == 200
     # TODO: Add `update` assertions, or remove this test.
 
 
-def assign_img_alt_attr():
+def assign_img_alt_attr(client: TestClient):
     """Assign `alt` attribute to all images in posts."""
     result = client.get("/posts/alt/")
     pp.pprint(result.json())
 
 
-def test_import_site_analytics():
+def test_import_site_analytics(client: TestClient):
     """Fetch site analytics."""
     response = client.get("/analytics/")
     assert response.status_code == 200
@@ -110,7 +124,7 @@ def test_accept_donation(donation: NewDonation):
     assert response.status_code == 400"""
 
 
-def test_authors_bulk_update_metadata():
+def test_authors_bulk_update_metadata(client: TestClient):
     """Fetch all author info."""
     response = client.get("/authors/")
     assert response.status_code >= 200
@@ -0,0 +1,83 @@
+"""On-disk image queue shared by multiple API processes."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from app.images import jobs
+from app.images.jobs import ImageQueue
+
+
+def test_claim_each_job_once(tmp_path):
+    """Queues sharing a file (as API workers do) never claim the same job."""
+    path = str(tmp_path / "image_queue.sqlite3")
+    queues = [ImageQueue(path, handler=lambda url: []) for _ in range(4)]
+    for i in range(50):
+        queues[0].enqueue(f"https://cdn.example.com/{i}.jpg")
+
+    def drain(queue: ImageQueue) -> list:
+        claimed = []
+        while (job := queue._claim()) is not None:
+            claimed.append(job[0])
+        return claimed
+
+    with ThreadPoolExecutor(max_workers=len(queues)) as executor:
+        claimed = [url for urls in executor.map(drain, queues) for url in urls]
+    assert sorted(claimed) == sorted(f"https://cdn.example.com/{i}.jpg" for i in range(50))
+
+
+def test_worker_survives_claim_error(tmp_path, monkeypatch):
+    """A failure outside of the image handler doesn't end the worker."""
+    queue = ImageQueue(str(tmp_path / "image_queue.sqlite3"), handler=lambda url: [url], workers=1)
+    claim = queue._claim
+    failures = [RuntimeError("database is locked")]
+
+    def flaky_claim():
+        if failures:
+            raise failures.pop()
+        return claim()
+
+    monkeypatch.setattr(queue, "_claim", flaky_claim)
+    monkeypatch.setattr(jobs, "WORKER_ERROR_DELAY", 0)
+
+    async def drain() -> int:
+        queue.enqueue("https://cdn.example.com/1.jpg")
+        await queue.start()
+        for _ in range(100):
+            if queue.pending() == 0:
+                break
+            await asyncio.sleep(0.01)
+        pending = queue.pending()
+        await queue.stop()
+        return pending
+
+    assert asyncio.run(drain()) == 0
+
+
+def test_reclaim_only_expired_leases(tmp_path):
+    """A starting process leaves jobs leased to live workers alone, but picks up jobs whose lease expired."""
+    path = str(tmp_path / "image_queue.sqlite3")
+    live = ImageQueue(path, handler=lambda url: [url])
+    dead = ImageQueue(path, handler=lambda url: [url], lease=0.05)
+    live.enqueue("https://cdn.example.com/live.jpg")
+    assert live._claim()[0] == "https://cdn.example.com/live.jpg"
+    dead.enqueue("https://cdn.example.com/dead.jpg")
+    assert dead._claim()[0] == "https://cdn.example.com/dead.jpg"
+    processed = []
+
+    def handler(url: str) -> list:
+        processed.append(url)
+        return [url]
+
+    async def restart() -> None:
+        await asyncio.sleep(0.1)
+        queue = ImageQueue(path, handler=handler, workers=1)
+        await queue.start()
+        for _ in range(100):
+            if queue.pending() == 1:
+                break
+            await asyncio.sleep(0.01)
+        await queue.stop()
+
+    asyncio.run(restart())
+    assert processed == ["https://cdn.example.com/dead.jpg"]
+    assert live.pending() == 1
@@ -0,0 +1,35 @@
+"""Connection budget & utilization of database pools."""
+
+import database
+from config import settings
+
+
+class FakePool:
+    """aiomysql pool with three of its four open connections in use."""
+
+    size = 4
+    freesize = 1
+    maxsize = 8
+
+
+def test_pools_share_connection_budget():
+    """Sync & async pools of a database never hold more connections than its budget."""
+    stats = database.pool_stats()
+    for name in (settings.SQLALCHEMY_GHOST_DATABASE_NAME, settings.SQLALCHEMY_FEATURES_DATABASE_NAME):
+        assert stats[name]["sync"]["size"] + stats[name]["sync"]["max_overflow"] == database.SYNC_POOL_SIZE
+        assert stats[name]["async"] == {"pool": "aiomysql", "connected": False}
+    assert database.SYNC_POOL_SIZE + database.ASYNC_POOL_SIZE == database.CONNECTION_BUDGET
+
+
+def test_async_pool_stats(monkeypatch):
+    """Utilization of a connected async pool is reported alongside the sync pool."""
+    monkeypatch.setattr(database.ghost_async_db.db._backend, "_pool", FakePool())
+    assert database.pool_stats()[settings.SQLALCHEMY_GHOST_DATABASE_NAME]["async"] == {
+        "pool": "FakePool",
+        "connected": True,
+        "size": 4,
+        "max_size": 8,
+        "checked_out": 3,
+        "checked_in": 1,
+        "utilization": 0.375,
+    }